@@ -4,8 +4,10 @@ admin manager module.
 """
 
 from copy import deepcopy
+from bisect import insort, bisect_left
+from itertools import groupby, count
+from operator import itemgetter
 
-import pyrin.utils.dictionary as dict_utils
 import pyrin.configuration.services as config_services
 import pyrin.database.paging.services as paging_services
 import pyrin.database.services as database_services
@@ -15,7 +17,7 @@ import pyrin.security.authentication.services as authentication_services
 
 from pyrin.core.globals import _
 from pyrin.admin import AdminPackage
-from pyrin.core.structs import Context, Manager
+from pyrin.core.structs import Manager, CoreImmutableDict
 from pyrin.admin.interface import AbstractAdminPage
 from pyrin.security.enumerations import InternalAuthenticatorEnum
 from pyrin.admin.enumerations import ListFieldTypeEnum, FormFieldTypeEnum
@@ -23,6 +25,39 @@ from pyrin.admin.exceptions import InvalidAdminPageTypeError, DuplicatedAdminPag
     AdminPageNotFoundError, AdminOperationNotAllowedError, AdminPagesHaveNotLoadedError
 
 
+# a map between all form field types and list field types.
+# as the client side table does not format the numeric values correctly, we
+# have to introduce numeric values as string to the client to keep the behavior
+# of these column types as others.
+FORM_TO_LIST_TYPE_MAP = CoreImmutableDict({
+    FormFieldTypeEnum.BOOLEAN: ListFieldTypeEnum.BOOLEAN,
+    FormFieldTypeEnum.DATE: ListFieldTypeEnum.DATE,
+    FormFieldTypeEnum.DATETIME: ListFieldTypeEnum.DATETIME,
+    FormFieldTypeEnum.TIME: ListFieldTypeEnum.TIME,
+    FormFieldTypeEnum.EMAIL: ListFieldTypeEnum.STRING,
+    FormFieldTypeEnum.FILE: ListFieldTypeEnum.STRING,
+    FormFieldTypeEnum.NUMBER: ListFieldTypeEnum.STRING,
+    FormFieldTypeEnum.INTEGER: ListFieldTypeEnum.STRING,
+    FormFieldTypeEnum.FLOAT: ListFieldTypeEnum.STRING,
+    FormFieldTypeEnum.PASSWORD: ListFieldTypeEnum.STRING,
+    FormFieldTypeEnum.TELEPHONE: ListFieldTypeEnum.STRING,
+    FormFieldTypeEnum.STRING: ListFieldTypeEnum.STRING,
+    FormFieldTypeEnum.TEXT: ListFieldTypeEnum.STRING,
+    FormFieldTypeEnum.URL: ListFieldTypeEnum.STRING,
+    FormFieldTypeEnum.UUID: ListFieldTypeEnum.STRING,
+    FormFieldTypeEnum.IPV4: ListFieldTypeEnum.STRING,
+    FormFieldTypeEnum.IPV6: ListFieldTypeEnum.STRING,
+    FormFieldTypeEnum.OBJECT: ListFieldTypeEnum.OBJECT,
+})
+
+# permission flags of admin operations.
+GET_PERMISSION = 1
+CREATE_PERMISSION = 2
+UPDATE_PERMISSION = 4
+REMOVE_PERMISSION = 8
+REMOVE_ALL_PERMISSION = 16
+
+
 class AdminManager(Manager):
     """
     admin manager class.
@@ -30,6 +65,31 @@ class AdminManager(Manager):
 
     package_class = AdminPackage
 
+    # a tuple containing the permission flag and the permission checker
+    # of admin pages for all admin operations permissions.
+    # in the form of:
+    # ((int permission_flag, str permission_checker))
+    _permission_checkers = (
+        (GET_PERMISSION, 'has_get_permission'),
+        (CREATE_PERMISSION, 'has_create_permission'),
+        (UPDATE_PERMISSION, 'has_update_permission'),
+        (REMOVE_PERMISSION, 'has_remove_permission'),
+        (REMOVE_ALL_PERMISSION, 'has_remove_all_permission'),
+    )
+
+    # a dict containing the permission flag and the operation
+    # title of all admin operations that require permission.
+    # in the form of:
+    # {str operation: (int permission_flag, str operation_title)}
+    _operations = {
+        'get': (GET_PERMISSION, 'get'),
+        'create': (CREATE_PERMISSION, 'create'),
+        'update': (UPDATE_PERMISSION, 'update'),
+        'remove': (REMOVE_PERMISSION, 'remove'),
+        'remove_bulk': (REMOVE_PERMISSION, 'remove'),
+        'remove_all': (REMOVE_ALL_PERMISSION, 'remove all'),
+    }
+
     def __init__(self, **options):
         """
         initializes an instance of AdminManager.
@@ -39,60 +99,52 @@ class AdminManager(Manager):
 
         # a dict containing all registered admin pages in the form of:
         # {str register_name: AbstractAdminPage instance}
-        self._admin_pages = Context()
+        self._admin_pages = dict()
 
         # a dict containing all registered admin pages for different entity types.
         # in the form of:
         # {BaseEntity entity: AbstractAdminPage instance}
-        self._admin_entities = Context()
+        self._admin_entities = dict()
 
         # a tuple of all available admin pages metadata sorted by category and name.
         # in the form of:
         # ({str category: [dict admin_metadata]})
         self._admin_metadata = None
 
-        # a dict containing a map between all form field types and list field types.
-        # for example: {str form_field_type: str list_field_type}
-        self._type_map = self._get_form_to_list_type_map()
-
-        self._base_url = self._load_base_url()
+        # a sorted list of all registered admin pages sort keys.
+        # it is kept sorted on each register or remove to prevent
+        # sorting all admin pages on each metadata population.
+        # pages with the same category and plural name are kept in registration order.
+        # in the form of:
+        # [(str category, str plural_name, int sequence, str register_name)]
+        self._sorted_pages = list()
 
-        # shared admin panel configs required for client.
-        self._configs = None
+        # a dict containing the sort key of each registered admin page.
+        # in the form of:
+        # {str register_name: tuple sort_key}
+        self._sort_keys = dict()
 
-    def _get_form_to_list_type_map(self):
-        """
-        gets the type map for different form fields to list fields.
+        # registration sequence of admin pages.
+        self._sequence = count()
 
-        **NOTE:**
+        self._base_url = self._load_base_url()
 
-        as the client side table does not format the numeric values correctly, we
-        have to introduce numeric values as string to the client to keep the behavior
-        of these column types as others.
+        # a dict containing the base url of all registered admin pages.
+        # urls are only cached if `get_admin_base_url` is not overridden,
+        # otherwise they will be calculated through it on each call.
+        # in the form of:
+        # {str register_name: str url}
+        self._admin_urls = dict()
+        self._cache_urls = type(self).get_admin_base_url is AdminManager.get_admin_base_url
 
-        :rtype: dict
-        """
+        # a dict containing the permission flags of each admin page.
+        # it will be filled on first operation on each admin page.
+        # in the form of:
+        # {AbstractAdminPage admin: int permissions}
+        self._permissions = dict()
 
-        result = Context()
-        result[FormFieldTypeEnum.BOOLEAN] = ListFieldTypeEnum.BOOLEAN
-        result[FormFieldTypeEnum.DATE] = ListFieldTypeEnum.DATE
-        result[FormFieldTypeEnum.DATETIME] = ListFieldTypeEnum.DATETIME
-        result[FormFieldTypeEnum.TIME] = ListFieldTypeEnum.TIME
-        result[FormFieldTypeEnum.EMAIL] = ListFieldTypeEnum.STRING
-        result[FormFieldTypeEnum.FILE] = ListFieldTypeEnum.STRING
-        result[FormFieldTypeEnum.NUMBER] = ListFieldTypeEnum.STRING
-        result[FormFieldTypeEnum.INTEGER] = ListFieldTypeEnum.STRING
-        result[FormFieldTypeEnum.FLOAT] = ListFieldTypeEnum.STRING
-        result[FormFieldTypeEnum.PASSWORD] = ListFieldTypeEnum.STRING
-        result[FormFieldTypeEnum.TELEPHONE] = ListFieldTypeEnum.STRING
-        result[FormFieldTypeEnum.STRING] = ListFieldTypeEnum.STRING
-        result[FormFieldTypeEnum.TEXT] = ListFieldTypeEnum.STRING
-        result[FormFieldTypeEnum.URL] = ListFieldTypeEnum.STRING
-        result[FormFieldTypeEnum.UUID] = ListFieldTypeEnum.STRING
-        result[FormFieldTypeEnum.IPV4] = ListFieldTypeEnum.STRING
-        result[FormFieldTypeEnum.IPV6] = ListFieldTypeEnum.STRING
-        result[FormFieldTypeEnum.OBJECT] = ListFieldTypeEnum.OBJECT
-        return result
+        # shared admin panel configs required for client.
+        self._configs = None
 
     def _load_base_url(self):
         """
@@ -107,28 +159,63 @@ class AdminManager(Manager):
 
         return url
 
-    def _remove_from_pages(self, register_name):
+    def _get_sort_key(self, instance):
         """
-        removes the admin page with given register name from admin pages.
+        gets a new sort key for given admin page.
 
-        it returns the removed admin page.
+        it sorts admin pages by category and plural name and then by registration order.
 
-        :param str register_name: register name of the admin page to be removed.
+        :param pyrin.admin.interface.AbstractAdminPage instance: admin page instance.
 
-        :rtype: pyrin.admin.interface.AbstractAdminPage
+        :returns: tuple[str category, str plural_name, int sequence, str register_name]
+        :rtype: tuple[str, str, int, str]
         """
 
-        instance = self._admin_pages.pop(register_name, None)
-        if instance is not None:
-            return self._remove_from_entities(instance.get_entity())
+        return instance.get_category(), instance.get_plural_name(), \
+            next(self._sequence), instance.get_register_name()
 
-        return instance
+    def _add_sort_key(self, instance):
+        """
+        adds the sort key of given admin page into sorted pages.
 
-    def _remove_from_entities(self, entity):
+        it also refreshes the main metadata if it has been populated.
+
+        :param pyrin.admin.interface.AbstractAdminPage instance: admin page instance.
+        """
+
+        key = self._get_sort_key(instance)
+        self._sort_keys[instance.get_register_name()] = key
+        insort(self._sorted_pages, key)
+        if self._admin_metadata is not None:
+            self.populate_main_metadata()
+
+    def _remove_sort_key(self, instance):
+        """
+        removes the sort key of given admin page from sorted pages.
+
+        it also refreshes the main metadata if it has been populated.
+
+        :param pyrin.admin.interface.AbstractAdminPage instance: admin page instance.
         """
-        removes the admin page with given entity from admin entities.
 
-        it returns the removed admin page.
+        key = self._sort_keys.pop(instance.get_register_name(), None)
+        if key is None:
+            return
+
+        index = bisect_left(self._sorted_pages, key)
+        if index < len(self._sorted_pages) and self._sorted_pages[index] == key:
+            del self._sorted_pages[index]
+            if self._admin_metadata is not None:
+                self.populate_main_metadata()
+
+    def _remove(self, register_name=None, entity=None):
+        """
+        removes the admin page with given register name or entity.
+
+        it removes the admin page from all registries and returns the removed admin page.
+        it returns None if no admin page found.
+
+        :param str register_name: register name of the admin page to be removed.
 
         :param type[pyrin.database.model.base.BaseEntity] entity: the entity class of
                                                                   admin page to be removed.
@@ -136,11 +223,24 @@ class AdminManager(Manager):
         :rtype: pyrin.admin.interface.AbstractAdminPage
         """
 
-        instance = self._admin_entities.pop(entity, None)
+        instance = None
+        if register_name is not None:
+            instance = self._admin_pages.pop(register_name, None)
+            if instance is not None:
+                self._admin_entities.pop(instance.get_entity(), None)
+
+        elif entity is not None:
+            instance = self._admin_entities.pop(entity, None)
+            if instance is not None:
+                register_name = instance.get_register_name()
+                self._admin_pages.pop(register_name, None)
+
         if instance is not None:
-            return self._remove_from_pages(instance.get_register_name())
+            self._admin_urls.pop(register_name, None)
+            self._permissions.pop(instance, None)
+            self._remove_sort_key(instance)
 
-        return None
+        return instance
 
     def _get_admin_page(self, register_name):
         """
@@ -154,12 +254,77 @@ class AdminManager(Manager):
         :rtype: pyrin.admin.interface.AbstractAdminPage
         """
 
+        pages = self._admin_pages
+        admin = pages.get(register_name)
+        if admin is not None:
+            return admin
+
         name = str(register_name).lower()
-        if name not in self._admin_pages:
+        admin = pages.get(name)
+        if admin is None:
             raise AdminPageNotFoundError(_('Admin page [{name}] not found.')
                                          .format(name=name))
 
-        return self._admin_pages.get(name)
+        return admin
+
+    def _get_permissions(self, admin):
+        """
+        gets the permission flags of given admin page.
+
+        the result will be cached until the admin page is removed.
+
+        :param pyrin.admin.interface.AbstractAdminPage admin: admin page instance.
+
+        :rtype: int
+        """
+
+        cached_permissions = self._permissions
+        permissions = cached_permissions.get(admin)
+        if permissions is None:
+            permissions = 0
+            for flag, checker in self._permission_checkers:
+                if getattr(admin, checker)():
+                    permissions |= flag
+
+            cached_permissions[admin] = permissions
+
+        return permissions
+
+    def _perform(self, register_name, operation, args=None, kwargs=None):
+        """
+        performs the given operation on admin page with given register name.
+
+        it checks the related permission of admin page before performing the operation.
+
+        :param str register_name: register name of admin page.
+
+        :param str operation: operation name to be performed.
+        :enum operation:
+            GET = 'get'
+            CREATE = 'create'
+            UPDATE = 'update'
+            REMOVE = 'remove'
+            REMOVE_BULK = 'remove_bulk'
+            REMOVE_ALL = 'remove_all'
+
+        :param tuple args: positional arguments of the operation.
+        :param dict kwargs: keyword arguments of the operation.
+
+        :raises AdminPageNotFoundError: admin page not found error.
+        :raises AdminOperationNotAllowedError: admin operation not allowed error.
+
+        :returns: operation result.
+        """
+
+        admin = self._get_admin_page(register_name)
+        permission, title = self._operations[operation]
+        if not self._get_permissions(admin) & permission:
+            raise AdminOperationNotAllowedError(_('Admin page [{name}] does '
+                                                  'not allow {operation} operation.')
+                                                .format(name=admin.get_register_name(),
+                                                        operation=title))
+
+        return getattr(admin, operation)(*(args or ()), **(kwargs or {}))
 
     def try_get_admin_page(self, entity):
         """
@@ -241,35 +406,36 @@ class AdminManager(Manager):
         """
 
         if not isinstance(instance, AbstractAdminPage):
-            raise InvalidAdminPageTypeError('Input parameter [{admin}] is '
-                                            'not an instance of [{base}].'
-                                            .format(admin=instance, base=AbstractAdminPage))
+            raise InvalidAdminPageTypeError(f'Input parameter [{instance}] is '
+                                            f'not an instance of [{AbstractAdminPage}].')
 
+        name = instance.get_register_name()
+        entity = instance.get_entity()
         replace = options.get('replace', False)
-        if instance.get_register_name() in self._admin_pages:
+        if name in self._admin_pages:
             if replace is not True:
-                raise DuplicatedAdminPageError('There is another registered admin page '
-                                               'with register name [{name}] but "replace" '
-                                               'option is not set, so admin page [{instance}] '
-                                               'could not be registered.'
-                                               .format(name=instance.get_register_name(),
-                                                       instance=instance))
+                raise DuplicatedAdminPageError(f'There is another registered admin page '
+                                               f'with register name [{name}] but "replace" '
+                                               f'option is not set, so admin page '
+                                               f'[{instance}] could not be registered.')
 
-            self._remove_from_pages(instance.get_register_name())
+            self._remove(register_name=name)
 
-        if instance.get_entity() in self._admin_entities:
+        if entity in self._admin_entities:
             if replace is not True:
-                raise DuplicatedAdminPageError('There is another registered admin page '
-                                               'for entity [{entity}] but "replace" '
-                                               'option is not set, so admin page [{instance}] '
-                                               'could not be registered.'
-                                               .format(entity=instance.get_entity(),
-                                                       instance=instance))
+                raise DuplicatedAdminPageError(f'There is another registered admin page '
+                                               f'for entity [{entity}] but "replace" '
+                                               f'option is not set, so admin page '
+                                               f'[{instance}] could not be registered.')
 
-            self._remove_from_entities(instance.get_entity())
+            self._remove(entity=entity)
 
-        self._admin_pages[instance.get_register_name()] = instance
-        self._admin_entities[instance.get_entity()] = instance
+        self._admin_pages[name] = instance
+        self._admin_entities[entity] = instance
+        if self._cache_urls is True:
+            self._admin_urls[name] = f'{self.get_admin_base_url()}{name}/'
+
+        self._add_sort_key(instance)
 
     def get(self, register_name, pk):
         """
@@ -284,13 +450,7 @@ class AdminManager(Manager):
         :rtype: pyrin.database.model.base.BaseEntity
         """
 
-        admin = self._get_admin_page(register_name)
-        if not admin.has_get_permission():
-            raise AdminOperationNotAllowedError(_('Admin page [{name}] does '
-                                                  'not allow get operation.')
-                                                .format(name=admin.get_register_name()))
-
-        return admin.get(pk)
+        return self._perform(register_name, 'get', (pk,))
 
     def find(self, register_name, **filters):
         """
@@ -319,13 +479,7 @@ class AdminManager(Manager):
         :rtype: object
         """
 
-        admin = self._get_admin_page(register_name)
-        if not admin.has_create_permission():
-            raise AdminOperationNotAllowedError(_('Admin page [{name}] does '
-                                                  'not allow create operation.')
-                                                .format(name=admin.get_register_name()))
-
-        return admin.create(**data)
+        return self._perform(register_name, 'create', kwargs=data)
 
     def update(self, register_name, pk, **data):
         """
@@ -340,13 +494,7 @@ class AdminManager(Manager):
         :raises EntityNotFoundError: entity not found error.
         """
 
-        admin = self._get_admin_page(register_name)
-        if not admin.has_update_permission():
-            raise AdminOperationNotAllowedError(_('Admin page [{name}] does '
-                                                  'not allow update operation.')
-                                                .format(name=admin.get_register_name()))
-
-        return admin.update(pk, **data)
+        return self._perform(register_name, 'update', (pk,), data)
 
     def remove(self, register_name, pk):
         """
@@ -358,13 +506,7 @@ class AdminManager(Manager):
         :raises AdminOperationNotAllowedError: admin operation not allowed error.
         """
 
-        admin = self._get_admin_page(register_name)
-        if not admin.has_remove_permission():
-            raise AdminOperationNotAllowedError(_('Admin page [{name}] does '
-                                                  'not allow remove operation.')
-                                                .format(name=admin.get_register_name()))
-
-        return admin.remove(pk)
+        return self._perform(register_name, 'remove', (pk,))
 
     def remove_bulk(self, register_name, pk):
         """
@@ -376,13 +518,7 @@ class AdminManager(Manager):
         :raises AdminOperationNotAllowedError: admin operation not allowed error.
         """
 
-        admin = self._get_admin_page(register_name)
-        if not admin.has_remove_permission():
-            raise AdminOperationNotAllowedError(_('Admin page [{name}] does '
-                                                  'not allow remove operation.')
-                                                .format(name=admin.get_register_name()))
-
-        return admin.remove_bulk(pk)
+        return self._perform(register_name, 'remove_bulk', (pk,))
 
     def remove_all(self, register_name):
         """
@@ -393,34 +529,18 @@ class AdminManager(Manager):
         :raises AdminOperationNotAllowedError: admin operation not allowed error.
         """
 
-        admin = self._get_admin_page(register_name)
-        if not admin.has_remove_all_permission():
-            raise AdminOperationNotAllowedError(_('Admin page [{name}] does '
-                                                  'not allow remove all operation.')
-                                                .format(name=admin.get_register_name()))
-
-        return admin.remove_all()
+        return self._perform(register_name, 'remove_all')
 
     def populate_main_metadata(self):
         """
         populates all admin pages main metadata.
         """
 
-        metadata = dict()
-        for name, admin in self._admin_pages.items():
-            pages = metadata.setdefault(admin.get_category(), [])
-            pages.append(admin.get_main_metadata())
-
-        result = list()
-        sorted_categories = sorted(metadata.keys())
-        for category in sorted_categories:
-            pages = metadata.get(category)
-            sorted_pages = dict_utils.extended_sort(pages, 'plural_name')
-            single_category = dict()
-            single_category[category] = sorted_pages
-            result.append(single_category)
-
-        self._admin_metadata = tuple(result)
+        pages = self._admin_pages
+        self._admin_metadata = tuple({category: [pages[item[3]].get_main_metadata()
+                                                 for item in group]}
+                                     for category, group in groupby(self._sorted_pages,
+                                                                    key=itemgetter(0)))
 
     def get_main_metadata(self):
         """
@@ -428,7 +548,7 @@ class AdminManager(Manager):
 
         :raises AdminPagesHaveNotLoadedError: admin pages have not loaded error.
 
-        :returns: dict(list pages,
+        :returns: dict(tuple pages,
                        dict configs)
         :rtype: dict
         """
@@ -436,7 +556,7 @@ class AdminManager(Manager):
         if self._admin_metadata is None:
             raise AdminPagesHaveNotLoadedError('Admin pages have not loaded yet.')
 
-        result = dict(pages=list(self._admin_metadata), configs=self.get_configs())
+        result = dict(pages=self._admin_metadata, configs=self.get_configs())
         return result
 
     def get_find_metadata(self, register_name):
@@ -506,7 +626,12 @@ class AdminManager(Manager):
         :rtype: str
         """
 
-        return f'{self.get_admin_base_url()}{register_name.lower()}/'
+        name = register_name.lower()
+        url = self._admin_urls.get(name)
+        if url is None:
+            url = f'{self.get_admin_base_url()}{name}/'
+
+        return url
 
     def get_list_field_type(self, form_field_type):
         """
@@ -536,7 +661,7 @@ class AdminManager(Manager):
         :rtype: str
         """
 
-        return self._type_map.get(form_field_type)
+        return FORM_TO_LIST_TYPE_MAP.get(form_field_type)
 
     def populate_caches(self):
         """
@@ -29,6 +29,7 @@ from pyrin.admin.page.schema import AdminSchema
 from pyrin.core.globals import SECURE_TRUE
 from pyrin.admin.page.mixin import AdminPageCacheMixin
 from pyrin.caching.mixin.decorators import fast_cache
+from pyrin.caching.decorators import cached_class_property
 from pyrin.database.orm.sql.schema.base import CoreColumn
 from pyrin.database.paging.paginator import SimplePaginator
 from pyrin.database.services import get_current_store
@@ -320,14 +321,36 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
             raise AdminNameRequiredError('The name for [{admin}] class is required.'
                                          .format(admin=self))
 
+        # register name is a class level constant, so it is normalized only once.
+        self._register_name = self.register_name.lower()
+
         # list of method names of this admin page to be used for processing the list results.
         self._method_names = self._extract_method_names()
+
+        # a dict containing all methods of this admin page to be used for processing
+        # the list results. in the form of: {str method_name: callable method}
+        self._methods = {name: getattr(self, name) for name in self._method_names}
+
         self._schema = AdminSchema(self,
                                    indexed=self.list_indexed,
                                    start_index=self.list_start_index,
                                    index_name=self.list_index_name,
                                    exclude=self._get_list_temp_field_names())
         self._paginator = None
+
+        # these values will be populated in `populate_caches()` to be used
+        # in find operation without going through cache lookups on each request.
+        # if they are not populated yet, they will be populated on first usage.
+        # they are the only cache of these values, so related methods are not cached.
+        self._selectable_fields = None
+        self._search_fields_to_column_map = None
+        self._list_entities = None
+        self._list_labels = None
+
+        # joins are only performed if `_perform_joins` method is overridden,
+        # otherwise it is a no-op and could be skipped in find operation.
+        self._has_joins = type(self)._perform_joins is not AdminPage._perform_joins
+
         if self.list_paged is True:
             self._paginator = self.paginator_class(self.FIND_ENDPOINT,
                                                    page_size=self._get_page_size(),
@@ -396,14 +419,16 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         name = name.replace('_', ' ')
         return string_normalizer_services.title_case(name)
 
-    @classmethod
-    @fast_cache
-    def _get_primary_key_name(cls):
+    @cached_class_property
+    def _primary_key_name(cls):
         """
         gets the name of the primary key of this admin page's related entity.
 
         note that if the entity has a composite primary key, this method raises an error.
 
+        :raises CompositePrimaryKeysNotSupportedError: composite primary keys
+                                                       not supported error.
+
         :rtype: str
         """
 
@@ -413,21 +438,32 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         raise CompositePrimaryKeysNotSupportedError('Composite primary keys are not '
                                                     'supported for admin page.')
 
-    @classmethod
-    def _get_primary_key_holder(cls, pk):
+    @cached_class_property
+    def _primary_key_column(cls):
         """
-        gets a dict with the primary key name of this page's entity set to the given value.
+        gets the primary key attribute of this admin page's related entity.
 
-        :param object pk: value to be set to primary key.
+        note that if the entity has a composite primary key, this method raises an error.
 
-        :rtype: dict
+        :raises CompositePrimaryKeysNotSupportedError: composite primary keys
+                                                       not supported error.
+
+        :rtype: sqlalchemy.orm.InstrumentedAttribute
         """
 
-        pk_name = cls._get_primary_key_name()
-        pk_holder = dict()
-        pk_holder[pk_name] = pk
+        return cls.entity.get_attribute(cls._primary_key_name)
 
-        return pk_holder
+    @classmethod
+    def _validate_primary_key(cls, pk):
+        """
+        validates the given value as the primary key of this page's entity.
+
+        :param object pk: primary key value to be validated.
+
+        :raises ValidationError: validation error.
+        """
+
+        validator_services.validate(cls.entity, **{cls._primary_key_name: pk})
 
     def _is_valid_field(self, field):
         """
@@ -494,29 +530,43 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         """
 
         names = []
+        append = names.append
+        is_valid_field = self._is_valid_field
+        is_valid_method = self._is_valid_method
         for item in fields:
-            if self._is_valid_field(item):
-                names.append(item.key)
-            elif allow_string is True and isinstance(item, str) \
-                    and self._is_valid_method(item):
-                names.append(item)
+            if is_valid_field(item):
+                append(item.key)
+            elif allow_string is True and isinstance(item, str) and is_valid_method(item):
+                append(item)
             else:
-                message = 'Provided field [{field}] is not a valid value. ' \
-                          'it must be a column attribute{sign} ' \
-                          'expression level hybrid property{end}'
-
-                if allow_string is True:
-                    message = message.format(
-                        field=str(item), sign=',',
-                        end=' or a string representing a method name of [{admin}] class.')
-                else:
-                    message = message.format(field=str(item), sign=' or',
-                                             end='.')
-
-                raise InvalidListFieldError(message.format(admin=self))
+                self._raise_invalid_field(item, allow_string)
 
         return tuple(names)
 
+    def _raise_invalid_field(self, field, allow_string):
+        """
+        raises an error for the given invalid list field.
+
+        :param object field: invalid field.
+        :param bool allow_string: specifies that string fields are also accepted.
+
+        :raises InvalidListFieldError: invalid list field error.
+        """
+
+        message = 'Provided field [{field}] is not a valid value. ' \
+                  'it must be a column attribute{sign} ' \
+                  'expression level hybrid property{end}'
+
+        if allow_string is True:
+            message = message.format(
+                field=str(field), sign=',',
+                end=' or a string representing a method name of [{admin}] class.')
+        else:
+            message = message.format(field=str(field), sign=' or',
+                                     end='.')
+
+        raise InvalidListFieldError(message.format(admin=self))
+
     @fast_cache
     def _get_list_field_names(self):
         """
@@ -640,7 +690,6 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
 
         return result
 
-    @fast_cache
     def _get_list_search_fields_to_column_map(self):
         """
         gets a dict of all list search field names and their related columns.
@@ -966,7 +1015,6 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         results = [item for item in self.list_temp_fields if self._is_valid_field(item)]
         return tuple(results)
 
-    @fast_cache
     def _get_selectable_fields(self):
         """
         gets all selectable fields of this admin page.
@@ -985,6 +1033,25 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
 
         return results
 
+    def _get_populated(self, name, method):
+        """
+        gets the populated value of given attribute name.
+
+        if it is not populated yet, it will be populated using given method.
+
+        :param str name: attribute name of populated value.
+        :param callable method: method to produce the value if it is not populated.
+
+        :returns: populated value.
+        """
+
+        value = getattr(self, name)
+        if value is None:
+            value = method()
+            setattr(self, name, value)
+
+        return value
+
     def _perform_joins(self, query, **options):
         """
         performs joins on given query and returns a new query object.
@@ -1029,7 +1096,9 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         :rtype: CoreQuery
         """
 
-        labeled_filters = self._get_list_search_fields_to_column_map()
+        labeled_filters = self._get_populated('_search_fields_to_column_map',
+                                              self._get_list_search_fields_to_column_map)
+
         search_text = filters.pop(self._get_search_param(), None)
         type_ = and_
         if self.list_search is True and search_text not in (None, ''):
@@ -1062,10 +1131,13 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         :rtype: CoreQuery
         """
 
-        filters.update(labeled_columns=SecureList(self._get_list_labels()))
+        labels = self._get_populated('_list_labels', self._get_list_labels)
+        entities = self._get_populated('_list_entities', self._get_list_entities)
+
+        filters.update(labeled_columns=SecureList(labels))
         force_order = list(self.list_ordering or [])
         force_order.extend(self.entity.primary_key_columns)
-        return query.safe_order_by(self._get_list_entities(), *force_order, **filters)
+        return query.safe_order_by(entities, *force_order, **filters)
 
     @fast_cache
     def _get_page_size(self):
@@ -1199,15 +1271,10 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         if not cls.extra_data_fields:
             return
 
-        not_present = []
-        for name in cls.extra_data_fields:
-            if data.get(name) is None:
-                not_present.append(name)
-
-        not_present = set(not_present)
-        if len(not_present) > 0:
+        not_present = [name for name in cls.extra_data_fields if data.get(name) is None]
+        if not_present:
             raise RequiredValuesNotProvidedError(_('These values are required: {values}')
-                                                 .format(values=list(not_present)))
+                                                 .format(values=not_present))
 
     @classmethod
     def _process_created_entity(cls, entity, **data):
@@ -1302,8 +1369,7 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         """
 
         store = get_current_store()
-        pk_name = cls._get_primary_key_name()
-        pk_column = cls.entity.get_attribute(pk_name)
+        pk_column = cls._primary_key_column
         store.query(cls.entity).filter(pk_column == pk).delete()
 
     def _remove_bulk(self, *pk):
@@ -1314,8 +1380,7 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         """
 
         store = get_current_store()
-        pk_name = self._get_primary_key_name()
-        pk_column = self.entity.get_attribute(pk_name)
+        pk_column = self._primary_key_column
         store.query(self.entity).filter(pk_column.in_(pk)).delete()
 
     def _remove_all(self):
@@ -1326,7 +1391,6 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         store = get_current_store()
         store.query(self.entity).delete()
 
-    @fast_cache
     def _get_list_entities(self):
         """
         gets all entities that are involved in list select query.
@@ -1334,7 +1398,7 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         :rtype: tuple[type[BaseEntity]]
         """
 
-        selectable_fields = self._get_selectable_fields()
+        selectable_fields = self._get_populated('_selectable_fields', self._get_selectable_fields)
         entities = []
         for item in selectable_fields:
             if isinstance(item, InstrumentedAttribute):
@@ -1342,7 +1406,6 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
 
         return tuple(set(entities))
 
-    @fast_cache
     def _get_list_labels(self):
         """
         gets all labels that are involved in list select query.
@@ -1350,7 +1413,7 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         :rtype: tuple[str]
         """
 
-        selectable_fields = self._get_selectable_fields()
+        selectable_fields = self._get_populated('_selectable_fields', self._get_selectable_fields)
         labels = []
         for item in selectable_fields:
             if isinstance(item, Label) and item.key != self._get_hidden_pk_name():
@@ -1639,7 +1702,6 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
 
         return self.entity
 
-    @fast_cache
     def get_register_name(self):
         """
         gets the register name of this admin page.
@@ -1647,7 +1709,7 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         :rtype: str
         """
 
-        return self.register_name.lower()
+        return self._register_name
 
     @fast_cache
     def get_category(self):
@@ -1697,7 +1759,7 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         :rtype: pyrin.database.model.base.BaseEntity
         """
 
-        validator_services.validate(self.entity, **self._get_primary_key_holder(pk))
+        self._validate_primary_key(pk)
         return self._get(pk)
 
     def find(self, **filters):
@@ -1712,9 +1774,12 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         """
 
         self._validate_filters(filters)
+        selectable_fields = self._get_populated('_selectable_fields', self._get_selectable_fields)
         store = get_current_store()
-        query = store.query(*self._get_selectable_fields())
-        query = self._perform_joins(query)
+        query = store.query(*selectable_fields)
+        if self._has_joins is True:
+            query = self._perform_joins(query)
+
         query = self._filter_query(query, **filters)
         query = self._perform_order_by(query, **filters)
         query = self._paginate_query(query, **filters)
@@ -1757,7 +1822,7 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         :raises EntityNotFoundError: entity not found error.
         """
 
-        validator_services.validate(cls.entity, **cls._get_primary_key_holder(pk))
+        cls._validate_primary_key(pk)
         validator_services.validate_dict(cls.entity, data, for_update=True)
         if cls.update_service is not None:
             cls.update_service(pk, **data)
@@ -1772,7 +1837,7 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         :param object pk: entity primary key to be deleted.
         """
 
-        validator_services.validate(cls.entity, **cls._get_primary_key_holder(pk))
+        cls._validate_primary_key(pk)
         if cls.remove_service is not None:
             cls.remove_service(pk)
         else:
@@ -1787,7 +1852,7 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
 
         pk = misc_utils.make_iterable(pk)
         for item in pk:
-            validator_services.validate(self.entity, **self._get_primary_key_holder(item))
+            self._validate_primary_key(item)
 
         self._remove_bulk(*pk)
 
@@ -1810,11 +1875,11 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         :rtype: object
         """
 
-        if name not in self.method_names:
+        method = self._methods.get(name)
+        if method is None:
             raise InvalidMethodNameError('Method [{method}] is not present in [{admin}] class.'
                                          .format(method=name, admin=self))
 
-        method = getattr(self, name)
         return method(argument)
 
     def has_get_permission(self):
@@ -1962,11 +2027,13 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         self.get_find_metadata()
         self.get_create_metadata()
         self.get_update_metadata()
-        self._get_list_search_fields_to_column_map()
         self._get_primary_keys()
         self._get_default_list_fields()
-        self._get_list_entities()
-        self._get_list_labels()
+        self._get_populated('_selectable_fields', self._get_selectable_fields)
+        self._get_populated('_search_fields_to_column_map',
+                            self._get_list_search_fields_to_column_map)
+        self._get_populated('_list_entities', self._get_list_entities)
+        self._get_populated('_list_labels', self._get_list_labels)
 
     @property
     def method_names(self):
@@ -172,8 +172,6 @@ class AdminSchema(ResultSchema):
         :rtype: dict
         """
 
-        result = {}
-        for method in self._admin.method_names:
-            result[method] = self._admin.call_method(method, row)
-
-        return result
+        admin = self._admin
+        call_method = admin.call_method
+        return {name: call_method(name, row) for name in admin.method_names}
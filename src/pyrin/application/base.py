@@ -559,8 +559,9 @@ class Application(Flask, HookMixin, SignalMixin,
             Component.make_component_id(component_name,
                                         component_custom_key=component_custom_key)
 
-        if component_custom_id in self._components.keys():
-            return self._components[component_custom_id]
+        component = self._components.get(component_custom_id)
+        if component is not None:
+            return component
 
         # getting default component.
         component_default_id = Component.make_component_id(component_name)
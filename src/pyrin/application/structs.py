@@ -72,7 +72,7 @@ class Component(CoreObject):
         :rtype: tuple[str, object]
         """
 
-        if component_name is None or len(component_name.strip()) <= 0:
+        if not component_name or component_name.isspace():
             raise InvalidComponentNameError('Component name should not be None.')
 
         component_custom_key = options.get('component_custom_key', DEFAULT_COMPONENT_KEY)
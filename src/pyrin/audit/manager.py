@@ -15,6 +15,7 @@ import pyrin.globalization.locale.services as locale_services
 from pyrin.audit.enumerations import InspectionStatusEnum
 from pyrin.audit.hooks import AuditHookBase
 from pyrin.core.mixin import HookMixin
+from pyrin.caching.decorators import cached_property
 from pyrin.core.structs import Manager
 from pyrin.audit import AuditPackage
 from pyrin.core.enumerations import ServerErrorResponseCodeEnum, SuccessfulResponseCodeEnum
@@ -33,6 +34,57 @@ class AuditManager(Manager, HookMixin):
     hook_type = AuditHookBase
     invalid_hook_type_error = InvalidAuditHookTypeError
 
+    # inspection steps which could be disabled by options.
+    # in the form of: tuple[tuple[str option_name, str method_name]]
+    _inspect_steps = (('application', 'get_application_info'),
+                      ('packages', '_get_packages_info'),
+                      ('framework', 'get_framework_info'),
+                      ('python', 'get_python_info'))
+
+    # platform info could not be changed while application is running. so it
+    # is calculated once on first inspection, some of them may even need a
+    # subprocess call, so they are not calculated on application startup.
+    @cached_property
+    def _python_info(self):
+        """
+        gets the current python version info which application is running on it.
+
+        :returns: dict(str version: python version,
+                       str implementation: python implementation)
+        :rtype: dict
+        """
+
+        return dict(version=platform.python_version(),
+                    implementation=platform.python_implementation())
+
+    @cached_property
+    def _operating_system_info(self):
+        """
+        gets the current operating system info.
+
+        :returns: dict(str name: os name,
+                       str release: os release,
+                       str version: os version)
+        :rtype: dict
+        """
+
+        return dict(name=platform.system(),
+                    release=platform.release(),
+                    version=platform.version())
+
+    @cached_property
+    def _hardware_info(self):
+        """
+        gets the current machine's hardware info.
+
+        :returns: dict(str processor: processor name,
+                       str machine: machine name)
+        :rtype: dict
+        """
+
+        return dict(processor=platform.processor(),
+                    machine=platform.machine())
+
     def _inspect_packages(self, **options):
         """
         this method will call `inspect` method of all registered hooks.
@@ -64,16 +116,18 @@ class AuditManager(Manager, HookMixin):
         all_succeeded = True
         include_traceback = options.get('traceback', True)
         for hook in self._get_hooks():
+            name = hook.audit_name
+            if options.get(name, True) is not True:
+                continue
+
             try:
-                should_inspect = options.get(hook.audit_name, True)
-                if should_inspect is True:
-                    result, succeeded = hook.inspect(**options)
-                    if succeeded is False:
-                        all_succeeded = False
-                    data[hook.audit_name] = result
+                result, succeeded = hook.inspect(**options)
+                if succeeded is False:
+                    all_succeeded = False
+                data[name] = result
             except Exception as error:
                 if raise_error is True:
-                    message = '[{name}] audit error: [{error}]'.format(name=hook.audit_name,
+                    message = '[{name}] audit error: [{error}]'.format(name=name,
                                                                        error=str(error))
                     raise AuditFailedError(message) from error
 
@@ -81,8 +135,8 @@ class AuditManager(Manager, HookMixin):
                 error_data = dict(status=InspectionStatusEnum.FAILED,
                                   error=str(error))
                 if include_traceback is not False:
-                    error_data.update(traceback=traceback.format_exc())
-                data[hook.audit_name] = error_data
+                    error_data['traceback'] = traceback.format_exc()
+                data[name] = error_data
 
         return data, all_succeeded
 
@@ -127,31 +181,15 @@ class AuditManager(Manager, HookMixin):
         """
 
         raise_error = options.get('raise_error', False)
-        application = options.get('application', True)
-        packages = options.get('packages', True)
-        framework = options.get('framework', True)
-        python = options.get('python', True)
-
         data, succeeded = self._inspect_packages(**options)
 
-        if application is True:
-            data.update(application=self.get_application_info(**options))
-
-        if packages is True:
-            packages = packaging_services.get_loaded_packages()
-            packages_info = dict(names=packages,
-                                 count=len(packages))
-            data.update(packages=packages_info)
-
-        if framework is True:
-            data.update(framework=self.get_framework_info(**options))
-
-        if python is True:
-            data.update(python=self.get_python_info(**options))
+        for name, method_name in self._inspect_steps:
+            if options.get(name, True) is True:
+                data[name] = getattr(self, method_name)(**options)
 
         platform_info = self.get_platform_info(**options)
         if len(platform_info) > 0:
-            data.update(platform=platform_info)
+            data['platform'] = platform_info
 
         if succeeded is False:
             if raise_error is False:
@@ -188,8 +226,7 @@ class AuditManager(Manager, HookMixin):
         :rtype: dict
         """
 
-        data = {}
-        data.update(name=application_services.get_application_name(),
+        return dict(name=application_services.get_application_name(),
                     version=application_services.get_application_version(),
                     server_datetime=datetime_services.now(),
                     server_timezone=datetime_services.get_timezone_name(server=True),
@@ -197,7 +234,18 @@ class AuditManager(Manager, HookMixin):
                     current_request_timezone=datetime_services.get_timezone_name(server=False),
                     default_locale=locale_services.get_default_locale(),
                     current_request_locale=locale_services.get_current_locale())
-        return data
+
+    def _get_packages_info(self, **options):
+        """
+        gets the info of loaded packages.
+
+        :returns: dict(list[str] names: loaded package names,
+                       int count: loaded packages count)
+        :rtype: dict
+        """
+
+        packages = packaging_services.get_loaded_packages()
+        return dict(names=packages, count=len(packages))
 
     def get_framework_info(self, **options):
         """
@@ -208,10 +256,8 @@ class AuditManager(Manager, HookMixin):
         :rtype: dict
         """
 
-        data = {}
-        data.update(name='pyrin',
+        return dict(name='pyrin',
                     version=application_services.get_pyrin_version())
-        return data
 
     def get_python_info(self, **options):
         """
@@ -222,11 +268,7 @@ class AuditManager(Manager, HookMixin):
         :rtype: dict
         """
 
-        data = {}
-        data.update(version=platform.python_version(),
-                    implementation=platform.python_implementation())
-
-        return data
+        return dict(self._python_info)
 
     def get_operating_system_info(self, **options):
         """
@@ -238,12 +280,7 @@ class AuditManager(Manager, HookMixin):
         :rtype: dict
         """
 
-        data = {}
-        data.update(name=platform.system(),
-                    release=platform.release(),
-                    version=platform.version())
-
-        return data
+        return dict(self._operating_system_info)
 
     def get_hardware_info(self, **options):
         """
@@ -254,11 +291,7 @@ class AuditManager(Manager, HookMixin):
         :rtype: dict
         """
 
-        data = {}
-        data.update(processor=platform.processor(),
-                    machine=platform.machine())
-
-        return data
+        return dict(self._hardware_info)
 
     def get_platform_info(self, **options):
         """
@@ -280,10 +313,10 @@ class AuditManager(Manager, HookMixin):
         data = {}
 
         if os is True:
-            data.update(os=self.get_operating_system_info(**options))
+            data['os'] = self.get_operating_system_info(**options)
 
         if hardware is True:
-            data.update(hardware=self.get_hardware_info(**options))
+            data['hardware'] = self.get_hardware_info(**options)
 
         return data
 
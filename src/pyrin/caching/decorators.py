@@ -424,6 +424,10 @@ class cached_class_property(class_property):
         return True
     """
 
+    # a marker to detect values which are not cached yet.
+    # it is required because `None` is also a valid cached value.
+    _not_cached = object()
+
     def __init__(self, method=None):
         """
         initializes an instance of cached_class_property.
@@ -450,12 +454,15 @@ class cached_class_property(class_property):
         if cls is None:
             cls = type(instance)
 
-        try:
-            return vars(cls)[self.__cache_name__]
-        except KeyError:
+        result = vars(cls).get(self.__cache_name__, self._not_cached)
+        if result is self._not_cached:
             result = super().__get__(instance, cls)
-            setattr(cls, self.__cache_name__, result)
-            return result
+
+            # `type.__setattr__` is used to bypass custom metaclass hooks. for example
+            # sqlalchemy declarative hooks expire mapper memoizations on each assignment.
+            type.__setattr__(cls, self.__cache_name__, result)
+
+        return result
 
     def _get_cache_key(self):
         """
@@ -3,6 +3,8 @@
 deserializer handlers base module.
 """
 
+import re
+
 from abc import abstractmethod
 
 from pyrin.converters.deserializer.exceptions import InvalidDeserializerTypeError
@@ -36,6 +38,10 @@ class DeserializerBase(AbstractDeserializerBase):
 
         self._internal = internal
 
+        # accepted type is constant for each deserializer, so we
+        # keep it to prevent property access on each deserialization.
+        self._accepted_type = self.accepted_type
+
     def deserialize(self, value, **options):
         """
         deserializes the given value.
@@ -132,7 +138,7 @@ class DeserializerBase(AbstractDeserializerBase):
         :rtype: bool
         """
 
-        return isinstance(value, self.accepted_type)
+        return isinstance(value, self._accepted_type)
 
     @property
     def internal(self):
@@ -177,9 +183,10 @@ class StringDeserializerBase(DeserializerBase):
 
         super().__init__(**options)
 
-        self._accepted_formats = self.default_formats
+        # a new list is always created to prevent mutating
+        # the default formats if they are shared by subclasses.
         custom_accepted_formats = options.get('accepted_formats', [])
-        self._accepted_formats.extend(custom_accepted_formats)
+        self._accepted_formats = [*self.default_formats, *custom_accepted_formats]
 
         # min and max accepted length of strings
         # to be deserialized by this deserializer.
@@ -194,11 +201,35 @@ class StringDeserializerBase(DeserializerBase):
         :rtype: bool
         """
 
-        if super().is_deserializable(value, **options) \
-                and self.is_valid_length(value.strip()):
-            return True
+        return self._get_stripped_value(value, **options) is not None
+
+    def _get_stripped_value(self, value, **options):
+        """
+        gets the stripped value if the given input is a deserializable string.
+
+        it returns None if the value is not deserializable. the value is
+        stripped only once to be reused by the caller.
+
+        :param object value: value to be deserialized.
+
+        :rtype: str
+        """
+
+        # the type check is done inline instead of calling `super().is_deserializable()`
+        # because this method is called for every value on each string deserializer.
+        if not isinstance(value, self._accepted_type):
+            return None
+
+        # blank values are detected without making a stripped copy of them.
+        if not value or value.isspace():
+            stripped_value = ''
+        else:
+            stripped_value = value.strip()
 
-        return False
+        if self.is_valid_length(stripped_value) is True:
+            return stripped_value
+
+        return None
 
     @property
     def accepted_type(self):
@@ -238,18 +269,14 @@ class StringDeserializerBase(DeserializerBase):
         """
         gets a value indicating that input value has valid length to be deserialized.
 
-        :param str value: value to be deserialized.
+        note that the value must be already stripped.
+
+        :param str value: stripped value to be deserialized.
 
         :rtype: bool
         """
 
-        length = len(value.strip())
-        min_length, max_length = self.accepted_length
-
-        if length < min_length or length > max_length:
-            return False
-
-        return True
+        return self._min_length <= len(value) <= self._max_length
 
     def _calculate_accepted_length(self):
         """
@@ -263,18 +290,27 @@ class StringDeserializerBase(DeserializerBase):
         # we should not enforce length restriction on values.
         min_length = None
         max_length = None
-        if self.UNDEF_LENGTH in [item[1] for item in self.accepted_formats]:
+        undefined_min = False
+        undefined_max = False
+        for item in self.accepted_formats:
+            current_min = item[1]
+            current_max = item[2]
+            if current_min == self.UNDEF_LENGTH:
+                undefined_min = True
+            elif min_length is None or current_min < min_length:
+                min_length = current_min
+
+            if current_max == self.UNDEF_LENGTH:
+                undefined_max = True
+            elif max_length is None or current_max > max_length:
+                max_length = current_max
+
+        if undefined_min is True:
             min_length = self.DEFAULT_MIN
 
-        if self.UNDEF_LENGTH in [item[2] for item in self.accepted_formats]:
+        if undefined_max is True:
             max_length = self.DEFAULT_MAX
 
-        if min_length is None:
-            min_length = min([item[1] for item in self.accepted_formats])
-
-        if max_length is None:
-            max_length = max([item[2] for item in self.accepted_formats])
-
         return min_length, max_length
 
     @property
@@ -299,6 +335,13 @@ class StringPatternDeserializerBase(StringDeserializerBase):
     this class uses regex to determine whether a value is deserializable or not.
     """
 
+    # this pattern is used to detect group references which prevent combining
+    # accepted patterns into a single pattern, because groups will be renumbered.
+    # these are numbered backreferences like `\1` or `\12`, named backreferences
+    # like `(?P=name)`, group references like `\g<1>` and conditional groups
+    # like `(?(1)yes|no)`.
+    BACKREFERENCE_REGEX = re.compile(r'\\[1-9]|\\g<|\(\?P=|\(\?\(')
+
     def __init__(self, **options):
         """
         initializes an instance of StringPatternDeserializerBase.
@@ -318,6 +361,53 @@ class StringPatternDeserializerBase(StringDeserializerBase):
 
         super().__init__(**options)
 
+        # all accepted patterns will be combined into a single pattern if
+        # possible, to be able to find the matching pattern with a single match.
+        self._combined_pattern, self._patterns_by_group = self._combine_patterns()
+
+        # if `is_deserializable` is not overridden, deserialization could reuse
+        # the stripped value of deserializable check instead of stripping it again.
+        self._default_deserializable_check = \
+            type(self).is_deserializable is StringPatternDeserializerBase.is_deserializable
+
+    def _combine_patterns(self):
+        """
+        combines all accepted patterns into a single alternation pattern.
+
+        each pattern is wrapped into a named group to be able to find the
+        original matching pattern. alternatives are tried in order, so the
+        result is the same as matching each pattern one by one.
+        patterns could only be combined if all of them have the same flags
+        and none of them have named groups or group references. otherwise it
+        returns None values.
+
+        :returns: tuple[Pattern combined_pattern, dict[str group_name, Pattern pattern]]
+        :rtype: tuple[Pattern, dict]
+        """
+
+        patterns = [item[0] for item in self.accepted_formats]
+        if len(patterns) <= 1:
+            return None, None
+
+        flags = patterns[0].flags
+        for pattern in patterns:
+            if pattern.flags != flags or pattern.groupindex or \
+                    self.BACKREFERENCE_REGEX.search(pattern.pattern):
+                return None, None
+
+        patterns_by_group = {}
+        alternatives = []
+        for index, pattern in enumerate(patterns):
+            name = 'pattern_{index}'.format(index=index)
+            patterns_by_group[name] = pattern
+            alternatives.append('(?P<{name}>{pattern})'.format(name=name,
+                                                                pattern=pattern.pattern))
+
+        try:
+            return re.compile('|'.join(alternatives), flags), patterns_by_group
+        except re.error:
+            return None, None
+
     def is_deserializable(self, value, **options):
         """
         gets a value indicating that the given input is deserializable.
@@ -330,12 +420,28 @@ class StringPatternDeserializerBase(StringDeserializerBase):
         :rtype: tuple[bool, Pattern]
         """
 
-        if super().is_deserializable(value, **options):
-            pattern = self.get_matching_pattern(value.strip())
+        stripped_value, pattern = self._get_matching_value(value, **options)
+        return pattern is not None, pattern
+
+    def _get_matching_value(self, value, **options):
+        """
+        gets the stripped value and its matching pattern if the given input is deserializable.
+
+        it returns None values if the value is not deserializable.
+
+        :param object value: value to be deserialized.
+
+        :returns: tuple[str stripped_value, Pattern pattern]
+        :rtype: tuple[str, Pattern]
+        """
+
+        stripped_value = self._get_stripped_value(value, **options)
+        if stripped_value is not None:
+            pattern = self.get_matching_pattern(stripped_value)
             if pattern is not None:
-                return True, pattern
+                return stripped_value, pattern
 
-        return False, None
+        return None, None
 
     def _deserialize_operation(self, value, **options):
         """
@@ -354,11 +460,18 @@ class StringPatternDeserializerBase(StringDeserializerBase):
         :returns: deserialized value.
         """
 
+        if self._default_deserializable_check is True:
+            stripped_value, pattern = self._get_matching_value(value, **options)
+        else:
+            stripped_value = None
+            deserializable, pattern = self.is_deserializable(value, **options)
+            if deserializable is True:
+                stripped_value = value.strip()
+
         deserialized_value = NULL
-        deserializable, pattern = self.is_deserializable(value, **options)
-        if deserializable is True:
+        if stripped_value is not None:
             options.update(matching_pattern=pattern)
-            deserialized_value = self._deserialize(value.strip(), **options)
+            deserialized_value = self._deserialize(stripped_value, **options)
 
         return deserialized_value
 
@@ -371,6 +484,13 @@ class StringPatternDeserializerBase(StringDeserializerBase):
         :rtype: Pattern
         """
 
+        if self._combined_pattern is not None:
+            match = self._combined_pattern.match(value)
+            if match is None:
+                return None
+
+            return self._patterns_by_group[match.lastgroup]
+
         for pattern, min_length, max_length in self.accepted_formats:
             if pattern.match(value):
                 return pattern
@@ -3,6 +3,8 @@
 deserializer handlers datetime module.
 """
 
+from datetime import date, time, datetime, timedelta, timezone
+
 import pyrin.globalization.datetime.services as datetime_services
 
 from pyrin.core.globals import NULL
@@ -13,6 +15,111 @@ from pyrin.utils.datetime import DEFAULT_DATE_TIME_ISO_REGEX, DEFAULT_DATE_ISO_R
     DEFAULT_LOCAL_NAIVE_DATE_TIME_REGEX, DEFAULT_UTC_ZULU_TIME_REGEX
 
 
+def _get_microsecond(fraction):
+    """
+    gets the microsecond value of given fraction part of a time string.
+
+    :param str fraction: fraction part including the leading dot.
+                         for example: `.98`. it could be an empty string.
+
+    :rtype: int
+    """
+
+    if not fraction:
+        return 0
+
+    return int(fraction[1:].ljust(6, '0'))
+
+
+def _to_date(value):
+    """
+    converts the given value which is matched by `DEFAULT_DATE_ISO_REGEX` to date.
+
+    :param str value: date string in the form of `YYYY-MM-DD`.
+
+    :raises ValueError: value error.
+
+    :rtype: date
+    """
+
+    return date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+
+
+def _to_naive_time(value):
+    """
+    converts the given value which is matched by `DEFAULT_LOCAL_NAIVE_TIME_REGEX` to time.
+
+    :param str value: time string in the form of `HH:mm:SS[.ffffff]`.
+
+    :raises ValueError: value error.
+
+    :rtype: time
+    """
+
+    return time(int(value[0:2]), int(value[3:5]), int(value[6:8]),
+                _get_microsecond(value[8:]))
+
+
+def _to_naive_datetime(value):
+    """
+    converts the given value which is matched by `DEFAULT_LOCAL_NAIVE_DATE_TIME_REGEX`
+    to datetime.
+
+    :param str value: datetime string in the form of `YYYY-MM-DDTHH:mm:SS[.ffffff]`.
+
+    :raises ValueError: value error.
+
+    :rtype: datetime
+    """
+
+    return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                    int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                    _get_microsecond(value[19:]))
+
+
+def _to_utc_zulu_datetime(value):
+    """
+    converts the given value which is matched by `DEFAULT_UTC_ZULU_DATE_TIME_REGEX`
+    to datetime.
+
+    :param str value: datetime string in the form of `YYYY-MM-DDTHH:mm:SS[.ffffff]Z`.
+
+    :raises ValueError: value error.
+
+    :rtype: datetime
+    """
+
+    return _to_naive_datetime(value[:-1]).replace(tzinfo=timezone.utc)
+
+
+def _to_offset_datetime(value):
+    """
+    converts the given value which is matched by `DEFAULT_DATE_TIME_ISO_REGEX` to datetime.
+
+    :param str value: datetime string in the form of `YYYY-MM-DDTHH:mm:SS[.ffffff]+HH:mm`.
+
+    :raises ValueError: value error.
+
+    :rtype: datetime
+    """
+
+    offset = timedelta(hours=int(value[-5:-3]), minutes=int(value[-2:]))
+    if value[-6] == '-':
+        offset = -offset
+
+    return _to_naive_datetime(value[:-6]).replace(tzinfo=timezone(offset))
+
+
+# a dict containing datetime patterns and their related converter
+# which could convert values matched by that pattern directly.
+# in the form of: {Pattern pattern: callable converter}
+DATETIME_CONVERTERS = {
+    DEFAULT_LOCAL_NAIVE_DATE_TIME_REGEX: _to_naive_datetime,
+    DEFAULT_UTC_ZULU_DATE_TIME_REGEX: _to_utc_zulu_datetime,
+    DEFAULT_DATE_TIME_ISO_REGEX: _to_offset_datetime,
+}
+
+
 @deserializer()
 class DateDeserializer(StringPatternDeserializerBase):
     """
@@ -52,6 +159,14 @@ class DateDeserializer(StringPatternDeserializerBase):
         :rtype: date
         """
 
+        # values in default iso format are converted directly. on any
+        # error, the value is handed to datetime services to raise the error.
+        if options.get('matching_pattern') is DEFAULT_DATE_ISO_REGEX:
+            try:
+                return _to_date(value)
+            except ValueError:
+                pass
+
         converted_date = datetime_services.to_date(value)
         if converted_date is not None:
             return converted_date
@@ -109,6 +224,14 @@ class TimeDeserializer(StringPatternDeserializerBase):
         :rtype: time
         """
 
+        # values in local naive format are converted directly. on any
+        # error, the value is handed to datetime services to raise the error.
+        if options.get('matching_pattern') is DEFAULT_LOCAL_NAIVE_TIME_REGEX:
+            try:
+                return _to_naive_time(value)
+            except ValueError:
+                pass
+
         converted_time = datetime_services.to_time(value)
         if converted_time is not None:
             return converted_time
@@ -168,9 +291,26 @@ class DateTimeDeserializer(StringPatternDeserializerBase):
         :rtype: datetime
         """
 
-        converted_datetime = datetime_services.to_datetime(value,
+        parsed_datetime = None
+
+        # values in default formats are parsed directly. on any error,
+        # the value is handed to datetime services to raise the error.
+        converter = DATETIME_CONVERTERS.get(options.get('matching_pattern'))
+        if converter is not None:
+            try:
+                parsed_datetime = converter(value)
+            except ValueError:
+                pass
+
+        if parsed_datetime is not None:
+            converted_datetime = datetime_services.convert(parsed_datetime,
                                                            to_server=False,
                                                            from_server=False)
+        else:
+            converted_datetime = datetime_services.to_datetime(value,
+                                                               to_server=False,
+                                                               from_server=False)
+
         if converted_datetime is not None:
             return converted_datetime
 
@@ -25,13 +25,18 @@ class SingletonMetaBase(type):
     _lock = Lock()
 
     def __call__(cls, *args, **kwargs):
-        if cls._has_instance() is False:
+        # the lock is only acquired when there is no registered instance yet,
+        # so subsequent calls just perform a single lookup.
+        instance = cls._get_instance()
+        if instance is None:
             with cls._lock:
                 if cls._has_instance() is False:
                     instance = super().__call__(*args, **kwargs)
                     cls._register_instance(instance)
+                else:
+                    instance = cls._get_instance()
 
-        return cls._get_instance()
+        return instance
 
     @abstractmethod
     def _has_instance(cls):
@@ -105,7 +105,10 @@ class DatabaseManager(Manager, HookMixin):
         :rtype: CoreSession
         """
 
-        return self._get_current_session_factory()(**kwargs)
+        session_factory = self._get_session_factory(
+            session_services.is_request_context_available())
+
+        return session_factory(**kwargs)
 
     def get_current_session_factory(self):
         """
@@ -183,13 +186,14 @@ class DatabaseManager(Manager, HookMixin):
         :rtype: CoreScopedSession
         """
 
-        if request_bounded not in self._session_factories:
+        session_factory = self._session_factories.get(request_bounded)
+        if session_factory is None:
             raise SessionFactoryNotExistedError('Session factory with '
                                                 'request_bounded={bounded} '
                                                 'is not available.'
                                                 .format(bounded=request_bounded))
 
-        return self._session_factories.get(request_bounded)
+        return session_factory
 
     def _create_default_engine(self):
         """
@@ -17,6 +17,7 @@ multi-database environments.
 import inspect
 
 from abc import abstractmethod
+from operator import attrgetter
 
 from sqlalchemy.orm import declared_attr
 from sqlalchemy.exc import NoInspectionAvailable
@@ -31,6 +32,7 @@ import pyrin.utils.misc as misc_utils
 
 from pyrin.core.globals import _
 from pyrin.core.decorators import class_property
+from pyrin.caching.decorators import cached_class_property
 from pyrin.caching.mixin.decorators import fast_cache
 from pyrin.caching.mixin.typed import TypedCacheMixin
 from pyrin.core.globals import LIST_TYPES, SECURE_TRUE, SECURE_FALSE
@@ -70,8 +72,7 @@ class ColumnMixin(ModelMixinBase):
     this class adds functionalities about columns (other than pk and fk) to its subclasses.
     """
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def all_columns(cls):
         """
         gets all column names of this entity.
@@ -89,8 +90,7 @@ class ColumnMixin(ModelMixinBase):
 
         return cls.readable_columns + cls.not_readable_columns
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def readable_columns(cls):
         """
         gets readable column names of this entity.
@@ -103,17 +103,9 @@ class ColumnMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        info = sqla_inspect(cls)
-        columns = tuple(attr.key for attr in info.column_attrs
-                        if cls.is_public(attr.key) is True and
-                        attr.columns[0].is_foreign_key is False and
-                        attr.columns[0].primary_key is False and
-                        attr.columns[0].allow_read is True)
-
-        return columns
+        return cls._get_column_groups()[0]
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def not_readable_columns(cls):
         """
         gets not readable column names of this entity.
@@ -126,17 +118,9 @@ class ColumnMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        info = sqla_inspect(cls)
-        columns = tuple(attr.key for attr in info.column_attrs
-                        if (cls.is_public(attr.key) is False or
-                            attr.columns[0].allow_read is False) and
-                        attr.columns[0].is_foreign_key is False and
-                        attr.columns[0].primary_key is False)
-
-        return columns
+        return cls._get_column_groups()[1]
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def writable_columns(cls):
         """
         gets writable column names of this entity.
@@ -149,17 +133,9 @@ class ColumnMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        info = sqla_inspect(cls)
-        columns = tuple(attr.key for attr in info.column_attrs
-                        if cls.is_public(attr.key) is True and
-                        attr.columns[0].is_foreign_key is False and
-                        attr.columns[0].primary_key is False and
-                        attr.columns[0].allow_write is True)
-
-        return columns
+        return cls._get_column_groups()[2]
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def not_writable_columns(cls):
         """
         gets not writable column names of this entity.
@@ -172,14 +148,48 @@ class ColumnMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
+        return cls._get_column_groups()[3]
+
+    @classmethod
+    @fast_cache
+    def _get_column_groups(cls):
+        """
+        gets readable, not readable, writable and not writable column names of this entity.
+
+        all groups are calculated in a single pass over column attributes.
+        note that primary and foreign keys are not included in columns.
+        column names will be calculated once and cached.
+
+        :returns: tuple[tuple[str] readable, tuple[str] not_readable,
+                        tuple[str] writable, tuple[str] not_writable]
+
+        :rtype: tuple[tuple[str], tuple[str], tuple[str], tuple[str]]
+        """
+
+        readable = []
+        not_readable = []
+        writable = []
+        not_writable = []
+        is_public = cls.is_public
         info = sqla_inspect(cls)
-        columns = tuple(attr.key for attr in info.column_attrs
-                        if (cls.is_public(attr.key) is False or
-                            attr.columns[0].allow_write is False) and
-                        attr.columns[0].is_foreign_key is False and
-                        attr.columns[0].primary_key is False)
+        for attr in info.column_attrs:
+            column = attr.columns[0]
+            if column.is_foreign_key is not False or column.primary_key is not False:
+                continue
+
+            key = attr.key
+            public = is_public(key)
+            if public is True and column.allow_read is True:
+                readable.append(key)
+            if public is False or column.allow_read is False:
+                not_readable.append(key)
+
+            if public is True and column.allow_write is True:
+                writable.append(key)
+            if public is False or column.allow_write is False:
+                not_writable.append(key)
 
-        return columns
+        return tuple(readable), tuple(not_readable), tuple(writable), tuple(not_writable)
 
     @classmethod
     def populate_cache(cls):
@@ -201,8 +211,7 @@ class RelationshipMixin(ModelMixinBase):
     this class adds functionalities about relationship properties to its subclasses.
     """
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def relationships(cls):
         """
         gets all relationship property names of this entity.
@@ -214,8 +223,7 @@ class RelationshipMixin(ModelMixinBase):
 
         return cls.exposed_relationships + cls.not_exposed_relationships
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def exposed_relationships(cls):
         """
         gets exposed relationship property names of this entity.
@@ -231,8 +239,7 @@ class RelationshipMixin(ModelMixinBase):
                               if cls.is_public(attr.key) is True)
         return relationships
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def not_exposed_relationships(cls):
         """
         gets not exposed relationship property names of this entity.
@@ -248,6 +255,21 @@ class RelationshipMixin(ModelMixinBase):
                               if cls.is_public(attr.key) is False)
         return relationships
 
+    @cached_class_property
+    def collection_relationships(cls):
+        """
+        gets relationship property names of this entity which hold a collection of entities.
+
+        property names will be calculated once and cached.
+
+        :rtype: frozenset[str]
+        """
+
+        info = sqla_inspect(cls)
+        relationships = frozenset(attr.key for attr in info.relationships
+                                  if attr.uselist is True)
+        return relationships
+
     @classmethod
     def populate_cache(cls):
         """
@@ -255,6 +277,7 @@ class RelationshipMixin(ModelMixinBase):
         """
 
         temp = cls.relationships
+        temp = cls.collection_relationships
         super().populate_cache()
 
 
@@ -265,8 +288,7 @@ class HybridPropertyMixin(ModelMixinBase):
     this class adds functionalities about all hybrid properties to its subclasses.
     """
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def all_getter_hybrid_properties(cls):
         """
         gets all getter hybrid property names of this entity.
@@ -278,8 +300,7 @@ class HybridPropertyMixin(ModelMixinBase):
 
         return cls.readable_hybrid_properties + cls.not_readable_hybrid_properties
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def all_setter_hybrid_properties(cls):
         """
         gets all setter hybrid property names of this entity.
@@ -291,8 +312,7 @@ class HybridPropertyMixin(ModelMixinBase):
 
         return cls.writable_hybrid_properties + cls.not_writable_hybrid_properties
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def readable_hybrid_properties(cls):
         """
         gets readable hybrid property names of this entity.
@@ -312,8 +332,7 @@ class HybridPropertyMixin(ModelMixinBase):
 
         return hybrid_properties
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def not_readable_hybrid_properties(cls):
         """
         gets not readable hybrid property names of this entity.
@@ -333,8 +352,7 @@ class HybridPropertyMixin(ModelMixinBase):
 
         return hybrid_properties
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def writable_hybrid_properties(cls):
         """
         gets writable hybrid property names of this entity.
@@ -354,8 +372,7 @@ class HybridPropertyMixin(ModelMixinBase):
 
         return hybrid_properties
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def not_writable_hybrid_properties(cls):
         """
         gets not writable hybrid property names of this entity.
@@ -375,8 +392,7 @@ class HybridPropertyMixin(ModelMixinBase):
 
         return hybrid_properties
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def expression_level_hybrid_properties(cls):
         """
         gets expression level hybrid property names of this entity.
@@ -460,8 +476,7 @@ class PrimaryKeyMixin(ModelMixinBase):
         else:
             return tuple(getattr(self, col) for col in columns)
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def primary_key_columns(cls):
         """
         gets all primary key column names of this entity.
@@ -478,8 +493,7 @@ class PrimaryKeyMixin(ModelMixinBase):
 
         return cls.readable_primary_key_columns + cls.not_readable_primary_key_columns
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def readable_primary_key_columns(cls):
         """
         gets the readable primary key column names of this entity.
@@ -491,15 +505,9 @@ class PrimaryKeyMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        info = sqla_inspect(cls)
-        pk = tuple(info.get_property_by_column(col).key for col in info.primary_key
-                   if cls.is_public(info.get_property_by_column(col).key) is True
-                   and col.allow_read is True)
-
-        return pk
+        return cls._get_primary_key_groups()[0]
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def not_readable_primary_key_columns(cls):
         """
         gets not readable primary key column names of this entity.
@@ -511,15 +519,9 @@ class PrimaryKeyMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        info = sqla_inspect(cls)
-        pk = tuple(info.get_property_by_column(col).key for col in info.primary_key
-                   if cls.is_public(info.get_property_by_column(col).key) is False
-                   or col.allow_read is False)
-
-        return pk
+        return cls._get_primary_key_groups()[1]
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def writable_primary_key_columns(cls):
         """
         gets the writable primary key column names of this entity.
@@ -531,15 +533,9 @@ class PrimaryKeyMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        info = sqla_inspect(cls)
-        pk = tuple(info.get_property_by_column(col).key for col in info.primary_key
-                   if cls.is_public(info.get_property_by_column(col).key) is True
-                   and col.allow_write is True)
+        return cls._get_primary_key_groups()[2]
 
-        return pk
-
-    @class_property
-    @fast_cache
+    @cached_class_property
     def not_writable_primary_key_columns(cls):
         """
         gets not writable primary key column names of this entity.
@@ -551,12 +547,43 @@ class PrimaryKeyMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
+        return cls._get_primary_key_groups()[3]
+
+    @classmethod
+    @fast_cache
+    def _get_primary_key_groups(cls):
+        """
+        gets readable, not readable, writable and not writable primary key column names.
+
+        all groups are calculated in a single pass over primary key columns.
+        column names will be calculated once and cached.
+
+        :returns: tuple[tuple[str] readable, tuple[str] not_readable,
+                        tuple[str] writable, tuple[str] not_writable]
+
+        :rtype: tuple[tuple[str], tuple[str], tuple[str], tuple[str]]
+        """
+
+        readable = []
+        not_readable = []
+        writable = []
+        not_writable = []
+        is_public = cls.is_public
         info = sqla_inspect(cls)
-        pk = tuple(info.get_property_by_column(col).key for col in info.primary_key
-                   if cls.is_public(info.get_property_by_column(col).key) is False
-                   or col.allow_write is False)
+        for col in info.primary_key:
+            key = info.get_property_by_column(col).key
+            public = is_public(key)
+            if public is True and col.allow_read is True:
+                readable.append(key)
+            if public is False or col.allow_read is False:
+                not_readable.append(key)
 
-        return pk
+            if public is True and col.allow_write is True:
+                writable.append(key)
+            if public is False or col.allow_write is False:
+                not_writable.append(key)
+
+        return tuple(readable), tuple(not_readable), tuple(writable), tuple(not_writable)
 
     @classmethod
     def populate_cache(cls):
@@ -578,8 +605,7 @@ class ForeignKeyMixin(ModelMixinBase):
     this class adds functionalities about foreign keys to its subclasses.
     """
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def foreign_key_columns(cls):
         """
         gets all foreign key column names of this entity.
@@ -598,8 +624,7 @@ class ForeignKeyMixin(ModelMixinBase):
 
         return cls.readable_foreign_key_columns + cls.not_readable_foreign_key_columns
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def readable_foreign_key_columns(cls):
         """
         gets the readable foreign key column names of this entity.
@@ -622,8 +647,7 @@ class ForeignKeyMixin(ModelMixinBase):
 
         return fk
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def not_readable_foreign_key_columns(cls):
         """
         gets not readable foreign key column names of this entity.
@@ -646,8 +670,7 @@ class ForeignKeyMixin(ModelMixinBase):
 
         return fk
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def writable_foreign_key_columns(cls):
         """
         gets the writable foreign key column names of this entity.
@@ -670,8 +693,7 @@ class ForeignKeyMixin(ModelMixinBase):
 
         return fk
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def not_writable_foreign_key_columns(cls):
         """
         gets not writable foreign key column names of this entity.
@@ -715,8 +737,7 @@ class AttributeMixin(ModelMixinBase):
     attributes includes pk, fk, columns, relationships and hybrid properties.
     """
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def all_column_attributes(cls):
         """
         gets an immutable dict of all column attributes of this entity.
@@ -734,8 +755,7 @@ class AttributeMixin(ModelMixinBase):
 
         return CoreImmutableDict(result)
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def all_reverse_column_attributes(cls):
         """
         gets an immutable dict of all reverse column attributes of this entity.
@@ -754,8 +774,7 @@ class AttributeMixin(ModelMixinBase):
 
         return CoreImmutableDict(result)
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def all_instrumented_attributes(cls):
         """
         gets a tuple of all instrumented attributes of this entity.
@@ -781,8 +800,7 @@ class AttributeMixin(ModelMixinBase):
 
         return tuple(result)
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def all_attributes(cls):
         """
         gets all attribute names of current entity.
@@ -794,8 +812,7 @@ class AttributeMixin(ModelMixinBase):
 
         return cls.all_readable_attributes + cls.all_not_readable_attributes
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def all_readable_attributes(cls):
         """
         gets all readable attribute names of current entity.
@@ -810,8 +827,7 @@ class AttributeMixin(ModelMixinBase):
         return cls.readable_primary_key_columns + cls.readable_foreign_key_columns + \
             cls.readable_columns + cls.exposed_relationships + cls.readable_hybrid_properties
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def all_not_readable_attributes(cls):
         """
         gets all not readable attribute names of current entity.
@@ -827,8 +843,7 @@ class AttributeMixin(ModelMixinBase):
             cls.not_readable_columns + cls.not_exposed_relationships + \
             cls.not_readable_hybrid_properties
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def all_writable_attributes(cls):
         """
         gets all writable attribute names of current entity.
@@ -843,8 +858,7 @@ class AttributeMixin(ModelMixinBase):
         return cls.writable_primary_key_columns + cls.writable_foreign_key_columns + \
             cls.writable_columns + cls.exposed_relationships + cls.writable_hybrid_properties
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def all_not_writable_attributes(cls):
         """
         gets all not writable attribute names of current entity.
@@ -921,7 +935,7 @@ class AttributeMixin(ModelMixinBase):
         super().populate_cache()
 
 
-class ConverterMixin:
+class ConverterMixin(ModelMixinBase):
     """
     converter mixin class.
 
@@ -936,6 +950,124 @@ class ConverterMixin:
     # this value could be overridden in concrete entities if required.
     MAX_DEPTH = 5
 
+    # option names which control the columns of conversion result.
+    _CONDITION_OPTIONS = frozenset(('columns', 'rename', 'exclude'))
+
+    @cached_class_property
+    def _all_attribute_names(cls):
+        """
+        gets all attribute names of current entity as a set.
+
+        attribute names will be calculated once and cached.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset(cls.all_attributes)
+
+    @cached_class_property
+    def _readable_attribute_names(cls):
+        """
+        gets all readable attribute names of current entity as a set.
+
+        attribute names will be calculated once and cached.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset(cls.all_readable_attributes)
+
+    @cached_class_property
+    def _relationship_names(cls):
+        """
+        gets all relationship property names of current entity as a set.
+
+        property names will be calculated once and cached.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset(cls.relationships)
+
+    @cached_class_property
+    def _exposed_relationship_names(cls):
+        """
+        gets exposed relationship property names of current entity as a set.
+
+        property names will be calculated once and cached.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset(cls.exposed_relationships)
+
+    @cached_class_property
+    def _all_scalar_accessor(cls):
+        """
+        gets all attribute names of current entity which are not relationships.
+
+        it also returns a getter to fetch values of these attributes from
+        an entity in a single call. they will be calculated once and cached.
+
+        :returns: tuple[tuple[str] attribute_names, callable getter]
+        :rtype: tuple[tuple[str], callable]
+        """
+
+        return cls._create_scalar_accessor(cls.all_attributes, cls._relationship_names)
+
+    @cached_class_property
+    def _readable_scalar_accessor(cls):
+        """
+        gets readable attribute names of current entity which are not relationships.
+
+        it also returns a getter to fetch values of these attributes from
+        an entity in a single call. they will be calculated once and cached.
+
+        :returns: tuple[tuple[str] attribute_names, callable getter]
+        :rtype: tuple[tuple[str], callable]
+        """
+
+        return cls._create_scalar_accessor(cls.all_readable_attributes,
+                                           cls._exposed_relationship_names)
+
+    @classmethod
+    def _create_scalar_accessor(cls, attributes, relations):
+        """
+        creates attribute names and a getter for given attributes excluding relationships.
+
+        the getter always returns a tuple of values in the same order of attribute names.
+
+        :param tuple[str] attributes: attribute names.
+        :param frozenset[str] relations: relationship names to be excluded.
+
+        :returns: tuple[tuple[str] attribute_names, callable getter]
+        :rtype: tuple[tuple[str], callable]
+        """
+
+        names = tuple(name for name in attributes if name not in relations)
+        if len(names) == 0:
+            return names, lambda entity: ()
+
+        if len(names) == 1:
+            single_getter = attrgetter(names[0])
+            return names, lambda entity: (single_getter(entity),)
+
+        return names, attrgetter(*names)
+
+    @classmethod
+    def populate_cache(cls):
+        """
+        populates all related caches.
+        """
+
+        temp = cls._all_attribute_names
+        temp = cls._readable_attribute_names
+        temp = cls._relationship_names
+        temp = cls._exposed_relationship_names
+        temp = cls._all_scalar_accessor
+        temp = cls._readable_scalar_accessor
+        super().populate_cache()
+
     def to_dict(self, **options):
         """
         converts the entity into a dict and returns it.
@@ -1058,35 +1190,65 @@ class ConverterMixin:
         :rtype: dict
         """
 
-        all_attributes = None
-        relations = None
-        requested_columns, rename, excluded_columns = self._extract_conditions(**options)
-        readable = options.get('readable', SECURE_TRUE)
+        if options.get('readable', SECURE_TRUE) is SECURE_FALSE:
+            return self._to_dict(self._all_attribute_names, self._relationship_names,
+                                 self._all_scalar_accessor, **options)
+
+        return self._to_dict(self._readable_attribute_names,
+                             self._exposed_relationship_names,
+                             self._readable_scalar_accessor, **options)
+
+    def _to_dict(self, all_attributes, relations, scalar_accessor, **options):
+        """
+        converts the entity into a dict using given attribute and relationship names.
+
+        :param frozenset[str] all_attributes: attribute names that could be included in result.
+        :param frozenset[str] relations: relationship names that could be included in result.
+
+        :param tuple[tuple[str], callable] scalar_accessor: attribute names which are not
+                                                            relationships and a getter to
+                                                            fetch their values.
+
+        :keyword dict[str, list[str]] | list[str] columns: column names to be included in result.
+        :keyword dict[str, dict[str, str]] | dict[str, str] rename: column names that must be
+                                                                    renamed in the result.
+
+        :keyword dict[str, list[str]] | list[str] exclude: column names to be excluded from
+                                                           result.
+
+        :keyword int depth: a value indicating the depth for conversion.
+
+        :raises InvalidDepthProvidedError: invalid depth provided error.
+
+        :rtype: dict
+        """
 
         depth = options.get('depth', None)
         if depth is None:
             depth = config_services.get('database', 'conversion', 'default_depth')
 
-        if readable is SECURE_FALSE:
-            all_attributes = self.all_attributes
-            relations = self.relationships
-        else:
-            all_attributes = self.all_readable_attributes
-            relations = self.exposed_relationships
-
-        requested_relationships = []
-        all_attributes = set(all_attributes)
-        if len(requested_columns) > 0:
-            requested_columns = requested_columns.intersection(all_attributes)
+        # most of the calls do not provide any column conditions, so
+        # there is no need to extract them and all attributes are requested.
+        # in this case, all non relationship values are fetched in a single call.
+        if options.keys().isdisjoint(self._CONDITION_OPTIONS):
+            names, getter = scalar_accessor
+            result = DTO(zip(names, getter(self)))
+            requested_relationships = relations
+            rename = {}
         else:
-            requested_columns = all_attributes.difference(excluded_columns)
-
-        result = DTO()
-        for col in requested_columns:
-            if col in relations:
-                requested_relationships.append(col)
+            requested_columns, rename, excluded_columns = self._extract_conditions(**options)
+            if len(requested_columns) > 0:
+                requested_columns = requested_columns.intersection(all_attributes)
             else:
-                result[rename.get(col, col)] = getattr(self, col)
+                requested_columns = all_attributes.difference(excluded_columns)
+
+            requested_relationships = []
+            result = DTO()
+            for col in requested_columns:
+                if col in relations:
+                    requested_relationships.append(col)
+                else:
+                    result[rename.get(col, col)] = getattr(self, col)
 
         if depth > 0 and len(requested_relationships) > 0:
             if depth > self.MAX_DEPTH:
@@ -1097,14 +1259,19 @@ class ConverterMixin:
                                                         invalid_depth=depth))
 
             options.update(depth=depth - 1)
+            collection_relationships = self.collection_relationships
             for relation in requested_relationships:
                 value = getattr(self, relation)
                 new_name = rename.get(relation, relation)
                 result[new_name] = None
                 if value is not None:
-                    if isinstance(value, LIST_TYPES):
+                    if relation in collection_relationships:
                         result[new_name] = []
                         if len(value) > 0:
+                            # dict based collections hold related entities as their values.
+                            if isinstance(value, dict):
+                                value = value.values()
+
                             for entity in value:
                                 result[new_name].append(entity.to_dict(**options))
                     else:
@@ -1455,8 +1622,7 @@ class MagicMethodMixin(ModelMixinBase):
         return '{fullname} -> {pk}'.format(fullname=self.get_fully_qualified_name(),
                                            pk=self.primary_key())
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def root_base_class(cls):
         """
         gets root base class of this entity.
@@ -2152,8 +2318,7 @@ class DefaultPrefetchMixin(ModelMixinBase):
 
         raise CoreNotImplementedError()
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def columns_with_scalar_insert_default(cls):
         """
         gets column names that have scalar default values for insert.
@@ -2171,8 +2336,7 @@ class DefaultPrefetchMixin(ModelMixinBase):
 
         return tuple(result)
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def columns_with_complex_insert_default(cls):
         """
         gets column names that have callable or sequence default values for insert.
@@ -2190,8 +2354,7 @@ class DefaultPrefetchMixin(ModelMixinBase):
 
         return tuple(result)
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def columns_with_scalar_update_default(cls):
         """
         gets column names that have scalar default values for update.
@@ -2209,8 +2372,7 @@ class DefaultPrefetchMixin(ModelMixinBase):
 
         return tuple(result)
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def columns_with_complex_update_default(cls):
         """
         gets column names that have callable or sequence default values for update.
@@ -2356,8 +2518,7 @@ class OrderingMixin(ModelMixinBase):
     # _ordering_columns = age, name, family -> allow ordering on three columns.
     _ordering_columns = None
 
-    @class_property
-    @fast_cache
+    @cached_class_property
     def ordering_column_names(cls):
         """
         gets all column attribute names which are allowed in order by.
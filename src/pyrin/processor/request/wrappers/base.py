@@ -65,14 +65,12 @@ class CoreRequest(Request):
 
         super().__init__(environ, populate_request, shallow)
 
-        self._request_id = uuid_utils.generate_uuid4()
+        self._request_id = uuid_utils.generate_pooled_uuid4()
         self._request_date = datetime_services.now()
         self._user = None
         self._cacheable_user = None
         self._user_info = None
         self._component_custom_key = DEFAULT_COMPONENT_KEY
-        self._client_ip = self._get_client_ip()
-        self._safe_content_length = self._get_safe_content_length()
         self._context = self.request_context_class()
 
         # a dict of all response cookies that must be sent in subsequent requests by client.
@@ -119,20 +117,11 @@ class CoreRequest(Request):
         self._body_decoding_error = None
 
     def __str__(self):
-        result = 'request id: "{request_id}", request date: "{request_date}", ' \
-                 'user: "{user}", method: "{method}", route: "{route}", ' \
-                 'endpoint: "{endpoint}", client_ip: "{client_ip}", locale: "{locale}", ' \
-                 'timezone: "{timezone}", component_custom_key: "{component}"'
-        return result.format(request_id=self.request_id,
-                             request_date=self.request_date,
-                             user=self.user,
-                             client_ip=self.client_ip,
-                             route=self.path,
-                             method=self.method,
-                             endpoint=self._get_endpoint(),
-                             locale=self.locale,
-                             timezone=self.timezone.zone,
-                             component=self.component_custom_key)
+        return f'request id: "{self.request_id}", request date: "{self.request_date}", ' \
+               f'user: "{self.user}", method: "{self.method}", route: "{self.path}", ' \
+               f'endpoint: "{self._get_endpoint()}", client_ip: "{self.client_ip}", ' \
+               f'locale: "{self.locale}", timezone: "{self.timezone.zone}", ' \
+               f'component_custom_key: "{self.component_custom_key}"'
 
     def __hash__(self):
         return hash(self.request_id)
@@ -690,7 +679,7 @@ class CoreRequest(Request):
 
         self._component_custom_key = component_custom_key
 
-    @property
+    @cached_property
     def client_ip(self):
         """
         gets current request's client ip if available, otherwise returns None.
@@ -698,9 +687,9 @@ class CoreRequest(Request):
         :rtype: str
         """
 
-        return self._client_ip
+        return self._get_client_ip()
 
-    @property
+    @cached_property
     def safe_content_length(self):
         """
         gets current request's content length if available, otherwise returns 0.
@@ -708,7 +697,7 @@ class CoreRequest(Request):
         :rtype: int
         """
 
-        return self._safe_content_length
+        return self._get_safe_content_length()
 
     @cached_property
     def locale(self):
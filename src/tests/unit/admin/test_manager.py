@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+admin test_manager module.
+"""
+
+from pyrin.admin.manager import AdminManager
+from pyrin.admin.interface import AbstractAdminPage
+
+
+class AdminPageMock(AbstractAdminPage):
+    """
+    admin page mock class.
+    """
+
+    category = None
+    plural_name = None
+    register_name = None
+
+    def get_entity(self):
+        """
+        gets the entity class of this admin page.
+
+        :rtype: type
+        """
+
+        return type(self)
+
+    def get_register_name(self):
+        """
+        gets the register name of this admin page.
+
+        :rtype: str
+        """
+
+        return self.register_name
+
+    def get_category(self):
+        """
+        gets the category of this admin page.
+
+        :rtype: str
+        """
+
+        return self.category
+
+    def get_plural_name(self):
+        """
+        gets the plural name of this admin page.
+
+        :rtype: str
+        """
+
+        return self.plural_name
+
+    def get_main_metadata(self):
+        """
+        gets the main metadata of this admin page.
+
+        :rtype: dict
+        """
+
+        return dict(register_name=self.register_name)
+
+
+class FirstAdminPageMock(AdminPageMock):
+    """
+    first admin page mock class.
+    """
+
+    category = 'SECOND'
+    plural_name = 'Zebras'
+    register_name = 'first'
+
+
+class SecondAdminPageMock(AdminPageMock):
+    """
+    second admin page mock class.
+    """
+
+    category = 'FIRST'
+    plural_name = 'Birds'
+    register_name = 'second'
+
+
+class ThirdAdminPageMock(AdminPageMock):
+    """
+    third admin page mock class.
+    """
+
+    category = 'SECOND'
+    plural_name = 'Apples'
+    register_name = 'third'
+
+
+class FourthAdminPageMock(AdminPageMock):
+    """
+    fourth admin page mock class.
+
+    it has the same category and plural name as `FirstAdminPageMock`
+    but its register name is sorted before it.
+    """
+
+    category = 'SECOND'
+    plural_name = 'Zebras'
+    register_name = 'a_fourth'
+
+
+class OrderAdminManagerMock(AdminManager):
+    """
+    order admin manager mock class.
+
+    managers are singleton, so a separate manager is used
+    to not affect admin pages of the application.
+    """
+    pass
+
+
+class ReplaceAdminManagerMock(AdminManager):
+    """
+    replace admin manager mock class.
+
+    managers are singleton, so a separate manager is used
+    to not affect admin pages of the application.
+    """
+    pass
+
+
+def _get_pages_order(manager):
+    """
+    gets the register names of admin pages in the order of main metadata.
+
+    :param AdminManager manager: admin manager instance.
+
+    :rtype: list[tuple[str, list[str]]]
+    """
+
+    result = []
+    for item in manager.get_main_metadata()['pages']:
+        for category, pages in item.items():
+            result.append((category, [page['register_name'] for page in pages]))
+
+    return result
+
+
+def test_main_metadata_order():
+    """
+    populates main metadata of admin pages. pages must be sorted by category
+    and plural name and then by registration order.
+    """
+
+    manager = OrderAdminManagerMock()
+    manager.register(FirstAdminPageMock())
+    manager.register(SecondAdminPageMock())
+    manager.register(ThirdAdminPageMock())
+    manager.register(FourthAdminPageMock())
+    manager.populate_main_metadata()
+
+    assert _get_pages_order(manager) == [('FIRST', ['second']),
+                                         ('SECOND', ['third', 'first', 'a_fourth'])]
+
+
+def test_main_metadata_order_after_replace():
+    """
+    replaces an already registered admin page after main metadata is populated.
+    the replaced page must be ordered as the last registered page among pages
+    with the same category and plural name.
+    """
+
+    manager = ReplaceAdminManagerMock()
+    manager.register(FirstAdminPageMock())
+    manager.register(FourthAdminPageMock())
+    manager.populate_main_metadata()
+    manager.register(FirstAdminPageMock(), replace=True)
+
+    assert _get_pages_order(manager) == [('SECOND', ['a_fourth', 'first'])]
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+caching test_decorators module.
+"""
+
+from pyrin.caching.decorators import cached_class_property
+
+
+class CachedParent:
+    """
+    cached parent class.
+    """
+
+    VALUE = 1
+    CALLS = []
+
+    @cached_class_property
+    def values(cls):
+        """
+        gets the values of this class.
+
+        :rtype: tuple[int]
+        """
+
+        cls.CALLS.append(cls)
+        return cls.VALUE,
+
+
+class CachedChild(CachedParent):
+    """
+    cached child class.
+    """
+
+    VALUE = 2
+
+
+class DeclarativeMetaMock(type):
+    """
+    declarative meta mock class.
+
+    it records all class attribute assignments like sqlalchemy declarative meta.
+    """
+
+    def __setattr__(cls, key, value):
+        """
+        sets the given value into class attribute and records its name.
+
+        :param str key: attribute name.
+        :param object value: attribute value.
+        """
+
+        cls.ASSIGNED.append(key)
+        super().__setattr__(key, value)
+
+
+class CachedDeclarative(metaclass=DeclarativeMetaMock):
+    """
+    cached declarative class.
+    """
+
+    ASSIGNED = []
+    CALLS = []
+
+    @cached_class_property
+    def nothing(cls):
+        """
+        gets a `None` value.
+
+        :rtype: NoneType
+        """
+
+        cls.CALLS.append(cls)
+        return None
+
+
+def test_cached_class_property_is_calculated_once():
+    """
+    tests that cached class property is calculated once per class.
+    """
+
+    assert CachedParent.values == (1,)
+    assert CachedParent().values == (1,)
+    assert CachedParent.CALLS.count(CachedParent) == 1
+
+
+def test_cached_class_property_is_separated_per_class():
+    """
+    tests that cached class property caches values separately for each subclass.
+    """
+
+    assert CachedChild.values == (2,)
+    assert CachedParent.values == (1,)
+    assert CachedChild().values == (2,)
+    assert CachedParent.CALLS.count(CachedChild) == 1
+
+
+def test_cached_class_property_bypasses_metaclass_setattr():
+    """
+    tests that cached class property does not call custom metaclass `__setattr__`.
+    """
+
+    temp = CachedDeclarative.nothing
+    assert CachedDeclarative.ASSIGNED == []
+
+
+def test_cached_class_property_caches_none():
+    """
+    tests that cached class property caches `None` values too.
+    """
+
+    assert CachedDeclarative.nothing is None
+    assert CachedDeclarative().nothing is None
+    assert CachedDeclarative.nothing is None
+    assert CachedDeclarative.CALLS.count(CachedDeclarative) == 1
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+deserializer test_handlers module.
+"""
+
+import re
+
+from pyrin.core.globals import NULL
+from pyrin.converters.deserializer.handlers.base import StringDeserializerBase, \
+    StringPatternDeserializerBase
+
+
+class EmptyStringDeserializer(StringDeserializerBase):
+    """
+    empty string deserializer class.
+    """
+
+    def _deserialize(self, value, **options):
+        """
+        deserializes the given value.
+
+        :param str value: value to be deserialized.
+
+        :rtype: str
+        """
+
+        return value
+
+    @property
+    def default_formats(self):
+        """
+        gets default accepted formats that this deserializer could deserialize value from.
+
+        :rtype: list[tuple[str, int, int]]
+        """
+
+        return [('', 0, 5)]
+
+
+class LongStringDeserializer(EmptyStringDeserializer):
+    """
+    long string deserializer class.
+    """
+
+    def is_valid_length(self, value):
+        """
+        gets a value indicating that input value has valid length to be deserialized.
+
+        :param str value: stripped value to be deserialized.
+
+        :rtype: bool
+        """
+
+        return len(value) > 1
+
+
+class OrderedPatternDeserializer(StringPatternDeserializerBase):
+    """
+    ordered pattern deserializer class.
+    """
+
+    PREFIX_REGEX = re.compile(r'^a.*$')
+    EXACT_REGEX = re.compile(r'^ab$')
+    GROUPED_REGEX = re.compile(r'^(b)(c|d)$')
+
+    def _deserialize(self, value, **options):
+        """
+        deserializes the given value.
+
+        :param str value: value to be deserialized.
+
+        :rtype: str
+        """
+
+        return value
+
+    @property
+    def default_formats(self):
+        """
+        gets default accepted patterns that this deserializer could deserialize value from.
+
+        :rtype: list[tuple[Pattern, int, int]]
+        """
+
+        return [(self.PREFIX_REGEX, 1, 10),
+                (self.EXACT_REGEX, 2, 2),
+                (self.GROUPED_REGEX, 2, 2)]
+
+
+class RestrictedPatternDeserializer(OrderedPatternDeserializer):
+    """
+    restricted pattern deserializer class.
+    """
+
+    def is_deserializable(self, value, **options):
+        """
+        gets a value indicating that the given input is deserializable.
+
+        it does not accept `abc` value.
+
+        :param object value: value to be deserialized.
+
+        :rtype: tuple[bool, Pattern]
+        """
+
+        if value.strip() == 'abc':
+            return False, None
+
+        return super().is_deserializable(value, **options)
+
+
+class CountingString(str):
+    """
+    counting string class.
+
+    it keeps the count of strip calls.
+    """
+
+    STRIP_CALLS = []
+
+    def strip(self, *args):
+        """
+        gets a stripped copy of this string and records the call.
+
+        :rtype: str
+        """
+
+        self.STRIP_CALLS.append(self)
+        return super().strip(*args)
+
+
+class GroupReferencePatternDeserializer(StringPatternDeserializerBase):
+    """
+    group reference pattern deserializer class.
+    """
+
+    REFERENCE_REGEX = re.compile(r'^(x)\1$')
+    CONDITIONAL_REGEX = re.compile(r'^(y)?(?(1)z|w)$')
+
+    def _deserialize(self, value, **options):
+        """
+        deserializes the given value.
+
+        :param str value: value to be deserialized.
+
+        :rtype: str
+        """
+
+        return value
+
+    @property
+    def default_formats(self):
+        """
+        gets default accepted patterns that this deserializer could deserialize value from.
+
+        :rtype: list[tuple[Pattern, int, int]]
+        """
+
+        return [(self.REFERENCE_REGEX, 2, 2),
+                (self.CONDITIONAL_REGEX, 1, 2)]
+
+
+def test_string_deserializer_accepts_zero_min_length():
+    """
+    tests that a string deserializer with zero min length accepts empty strings.
+    """
+
+    deserializer = EmptyStringDeserializer()
+    assert deserializer.accepted_length == (0, 5)
+    assert deserializer.is_deserializable('') is True
+    assert deserializer.is_deserializable('   ') is True
+    assert deserializer.is_deserializable(' abc ') is True
+    assert deserializer.is_deserializable('abcdef') is False
+    assert deserializer.is_deserializable(12) is False
+
+
+def test_string_deserializer_rejects_blank_values():
+    """
+    tests that a string deserializer rejects blank values if min length is not zero.
+    """
+
+    deserializer = LongStringDeserializer()
+    assert deserializer.is_deserializable('') is False
+    assert deserializer.is_deserializable(' \t\n ') is False
+
+
+def test_string_deserializer_uses_is_valid_length():
+    """
+    tests that a string deserializer checks stripped values with `is_valid_length`.
+    """
+
+    deserializer = LongStringDeserializer()
+    assert deserializer.is_valid_length('ab') is True
+    assert deserializer.is_deserializable(' a ') is False
+    assert deserializer.is_deserializable(' ab ') is True
+
+
+def test_pattern_deserializer_matches_in_order():
+    """
+    tests that combined patterns return the first matching pattern in accepted order.
+    """
+
+    deserializer = OrderedPatternDeserializer()
+    assert deserializer._combined_pattern is not None
+    assert deserializer.get_matching_pattern('ab') is OrderedPatternDeserializer.PREFIX_REGEX
+    assert deserializer.get_matching_pattern('abc') is OrderedPatternDeserializer.PREFIX_REGEX
+    assert deserializer.get_matching_pattern('c') is None
+
+
+def test_pattern_deserializer_maps_last_group_to_pattern():
+    """
+    tests that combined patterns map the matched group to the original pattern.
+
+    even if the original pattern has its own unnamed groups.
+    """
+
+    deserializer = OrderedPatternDeserializer()
+    assert deserializer.get_matching_pattern('bc') is OrderedPatternDeserializer.GROUPED_REGEX
+    assert deserializer.get_matching_pattern('bd') is OrderedPatternDeserializer.GROUPED_REGEX
+    assert deserializer.is_deserializable(' bd ') == \
+        (True, OrderedPatternDeserializer.GROUPED_REGEX)
+
+
+def test_pattern_deserializer_does_not_combine_group_references():
+    """
+    tests that patterns with group references are matched one by one.
+    """
+
+    deserializer = GroupReferencePatternDeserializer()
+    assert deserializer._combined_pattern is None
+    assert deserializer.get_matching_pattern('xx') is \
+        GroupReferencePatternDeserializer.REFERENCE_REGEX
+
+    assert deserializer.get_matching_pattern('yz') is \
+        GroupReferencePatternDeserializer.CONDITIONAL_REGEX
+
+    assert deserializer.get_matching_pattern('w') is \
+        GroupReferencePatternDeserializer.CONDITIONAL_REGEX
+
+    assert deserializer.get_matching_pattern('xy') is None
+
+
+def test_pattern_deserializer_strips_value_once():
+    """
+    tests that pattern deserializer strips the value only once on deserialization.
+    """
+
+    deserializer = OrderedPatternDeserializer()
+    value = CountingString(' abc ')
+    assert deserializer._deserialize_operation(value) == 'abc'
+    assert CountingString.STRIP_CALLS.count(value) == 1
+
+
+def test_pattern_deserializer_respects_overridden_is_deserializable():
+    """
+    tests that pattern deserializer uses overridden `is_deserializable` on deserialization.
+    """
+
+    deserializer = RestrictedPatternDeserializer()
+    assert deserializer._deserialize_operation(' abc ') is NULL
+    assert deserializer._deserialize_operation(' abd ') == 'abd'
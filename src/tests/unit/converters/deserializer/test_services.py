@@ -8,14 +8,20 @@ import pytest
 from sqlalchemy.pool import QueuePool, AssertionPool
 
 import pyrin.converters.deserializer.services as deserializer_services
+import pyrin.globalization.datetime.services as datetime_services
 
 from pyrin.converters.deserializer.handlers.base import DeserializerBase
 from pyrin.core.structs import DTO
 from pyrin.converters.deserializer.handlers.boolean import BooleanDeserializer
+from pyrin.converters.deserializer.handlers.datetime import DateDeserializer, \
+    TimeDeserializer, DateTimeDeserializer
 from pyrin.converters.deserializer.handlers.dictionary import DictionaryDeserializer
 from pyrin.converters.deserializer.handlers.list import StringListDeserializer
 from pyrin.converters.deserializer.exceptions import InvalidDeserializerTypeError, \
     DuplicatedDeserializerError
+from pyrin.utils.datetime import DEFAULT_DATE_ISO_REGEX, DEFAULT_LOCAL_NAIVE_TIME_REGEX, \
+    DEFAULT_LOCAL_NAIVE_DATE_TIME_REGEX, DEFAULT_UTC_ZULU_DATE_TIME_REGEX, \
+    DEFAULT_DATE_TIME_ISO_REGEX
 
 
 def test_deserialize_bool_from_string():
@@ -76,6 +82,86 @@ def test_deserialize_time_without_timezone_from_string():
     assert value.second == 15 and value.minute == 12 and value.hour == 20
 
 
+def test_deserialize_date_directly_same_as_services():
+    """
+    deserializes the given iso date values directly.
+    the results must be the same as datetime services results.
+    """
+
+    deserializer = DateDeserializer()
+    for value in ('2019-09-01', '2020-02-29', '1999-12-31'):
+        result = deserializer.deserialize(value)
+        assert result == datetime_services.to_date(value)
+        assert result == deserializer_services.deserialize(value)
+        assert deserializer._deserialize(value, matching_pattern=DEFAULT_DATE_ISO_REGEX) == \
+            datetime_services.to_date(value)
+
+
+def test_deserialize_time_directly_same_as_services():
+    """
+    deserializes the given naive time values with different fractions directly.
+    the results must be the same as datetime services results.
+    """
+
+    deserializer = TimeDeserializer()
+    for value in ('20:12:15', '20:12:15.1', '20:12:15.12', '20:12:15.123',
+                  '20:12:15.1234', '20:12:15.12345', '00:00:00.123456'):
+        result = deserializer._deserialize(value,
+                                           matching_pattern=DEFAULT_LOCAL_NAIVE_TIME_REGEX)
+        assert result == datetime_services.to_time(value)
+        assert result == deserializer_services.deserialize(value)
+
+
+def test_deserialize_datetime_directly_same_as_services():
+    """
+    deserializes the given datetime values of all default patterns directly.
+    the results must be the same as normalized datetime services results.
+    """
+
+    deserializer = DateTimeDeserializer()
+    values = [(DEFAULT_LOCAL_NAIVE_DATE_TIME_REGEX, '2019-09-01T20:12:15'),
+              (DEFAULT_LOCAL_NAIVE_DATE_TIME_REGEX, '2019-09-01T20:12:15.1'),
+              (DEFAULT_LOCAL_NAIVE_DATE_TIME_REGEX, '2019-09-01T20:12:15.123456'),
+              (DEFAULT_UTC_ZULU_DATE_TIME_REGEX, '2019-09-01T20:12:15Z'),
+              (DEFAULT_UTC_ZULU_DATE_TIME_REGEX, '2019-09-01T20:12:15.12Z'),
+              (DEFAULT_UTC_ZULU_DATE_TIME_REGEX, '2019-09-01T20:12:15.12345Z'),
+              (DEFAULT_DATE_TIME_ISO_REGEX, '2019-09-01T20:12:15+00:00'),
+              (DEFAULT_DATE_TIME_ISO_REGEX, '2019-09-01T20:12:15.123+03:30'),
+              (DEFAULT_DATE_TIME_ISO_REGEX, '2019-09-01T20:12:15.1234-04:15'),
+              (DEFAULT_DATE_TIME_ISO_REGEX, '2019-12-31T23:59:59.123456-00:30')]
+
+    for pattern, value in values:
+        assert deserializer.get_matching_pattern(value) is pattern
+
+        expected = datetime_services.to_datetime(value, to_server=False, from_server=False)
+        result = deserializer._deserialize(value, matching_pattern=pattern)
+        assert result == expected
+        assert result.utcoffset() == expected.utcoffset()
+        assert deserializer_services.deserialize(value) == expected
+
+
+def test_deserialize_invalid_datetime_falls_back_to_services():
+    """
+    deserializes values that match default patterns but are not valid.
+    the same error as datetime services must be raised.
+    """
+
+    with pytest.raises(ValueError):
+        DateDeserializer()._deserialize('2019-02-30', matching_pattern=DEFAULT_DATE_ISO_REGEX)
+
+    with pytest.raises(ValueError):
+        TimeDeserializer()._deserialize('25:12:15',
+                                        matching_pattern=DEFAULT_LOCAL_NAIVE_TIME_REGEX)
+
+    with pytest.raises(ValueError):
+        DateTimeDeserializer()._deserialize('2019-02-30T20:12:15+01:00',
+                                            matching_pattern=DEFAULT_DATE_TIME_ISO_REGEX)
+
+    with pytest.raises(ValueError):
+        DateTimeDeserializer()._deserialize('2019-02-30T20:12:15Z',
+                                            matching_pattern=DEFAULT_UTC_ZULU_DATE_TIME_REGEX)
+
+
 def test_deserialize_string_from_string():
     """
     deserializes the given string value from string.
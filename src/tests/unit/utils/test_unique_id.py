@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+utils test_unique_id module.
+"""
+
+import os
+import uuid
+
+import pytest
+
+import pyrin.utils.unique_id as uuid_utils
+
+
+def test_generate_pooled_uuid4():
+    """
+    generates a unique id from the pool. it should be a version 4 uuid.
+    """
+
+    result = uuid_utils.generate_pooled_uuid4()
+
+    assert isinstance(result, uuid.UUID)
+    assert result.version == 4
+    assert result.variant == uuid.RFC_4122
+
+
+def test_generate_pooled_uuid4_is_unique_across_refills():
+    """
+    generates more unique ids than the pool size.
+    it should refill the pool and all generated ids must be unique version 4 uuids.
+    """
+
+    count = uuid_utils.UUID_POOL_SIZE * 3 + 1
+    result = [uuid_utils.generate_pooled_uuid4() for _ in range(count)]
+
+    assert len(set(result)) == count
+    assert all(item.version == 4 for item in result)
+
+
+@pytest.mark.skipif(not hasattr(os, 'register_at_fork'),
+                    reason='pooling is not available on this platform.')
+def test_generate_pooled_uuid4_after_reset():
+    """
+    resets the pool the same way it is done in forked child processes.
+    it should not return any of the previously pooled uuids.
+    """
+
+    uuid_utils.generate_pooled_uuid4()
+    pooled = set(uuid_utils._uuid_pool.items)
+    uuid_utils._reset_uuid_pool()
+
+    assert getattr(uuid_utils._uuid_pool, 'items', None) is None
+    assert uuid_utils.generate_pooled_uuid4() not in pooled
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork') or not hasattr(os, 'register_at_fork'),
+                    reason='fork is not available on this platform.')
+def test_generate_pooled_uuid4_in_forked_process():
+    """
+    generates a unique id in a forked child process.
+    it should not return any of the uuids pooled in the parent process.
+    """
+
+    uuid_utils.generate_pooled_uuid4()
+    pooled = set(uuid_utils._uuid_pool.items)
+    reader, writer = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(reader)
+            os.write(writer, uuid_utils.generate_pooled_uuid4().bytes)
+            os.close(writer)
+        finally:
+            os._exit(0)
+
+    os.close(writer)
+    child_bytes = os.read(reader, 16)
+    os.close(reader)
+    os.waitpid(pid, 0)
+
+    assert len(child_bytes) == 16
+    assert uuid.UUID(bytes=child_bytes) not in pooled